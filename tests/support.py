@@ -0,0 +1,12 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+
+class TempDirTestCase(unittest.TestCase):
+    """TestCase with a fresh temporary directory in `self.tmp`, removed after each test."""
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
@@ -1,6 +1,17 @@
 import unittest
+from dataclasses import asdict
 
-from wg_drift.contracts import extract_contract, parse_contract, replace_contract_block, TaskContract
+from wg_drift.contracts import (
+    DEFAULT_CONTRACT_RAW,
+    DEFAULT_NON_GOALS,
+    TaskContract,
+    extract_contract,
+    format_default_contract_block,
+    parse_contract,
+    render_contract_block,
+    replace_contract_block,
+    update_contract,
+)
 
 
 class ContractTests(unittest.TestCase):
@@ -12,6 +23,16 @@ class ContractTests(unittest.TestCase):
         c = TaskContract.from_raw(raw, fallback_objective="fallback")
         self.assertEqual(c.mode, "core")
         self.assertEqual(c.touch, ["src/**"])
+        self.assertEqual(len({c, TaskContract.from_raw(raw, fallback_objective="fallback")}), 1)
+        self.assertEqual(hash(c), hash(c))
+        self.assertNotIn("_hash", asdict(c))
+
+    def test_from_raw_copies_lists(self) -> None:
+        raw = {"non_goals": ["a"], "acceptance": ["b"], "touch": ["c/**"]}
+        c = TaskContract.from_raw(raw, fallback_objective="x")
+        c.non_goals.append("z")
+        c.acceptance.append("z")
+        self.assertEqual(raw, {"non_goals": ["a"], "acceptance": ["b"], "touch": ["c/**"]})
 
     def test_replace_contract_block(self) -> None:
         desc = "hello\n\n```wg-contract\nschema = 1\nmode = \"core\"\nobjective = \"x\"\ntouch = []\n```\n\ntail\n"
@@ -21,6 +42,52 @@ class ContractTests(unittest.TestCase):
         raw = parse_contract(body or "")
         self.assertEqual(raw.get("touch"), ["src/**"])
 
+    def test_replace_contract_block_leading_fence(self) -> None:
+        raw = {"schema": 1, "mode": "core", "touch": ["a/**"]}
+        block = render_contract_block(raw)
+        old = "```wg-contract\nschema = 1\n```"
+
+        self.assertEqual(replace_contract_block(f"{old}\ntail\n", raw), f"{block}tail\n")
+        self.assertEqual(replace_contract_block(f"\n\n{old}\n\ntail", raw), f"{block}\ntail")
+        self.assertEqual(replace_contract_block(f"\n\nhead\n{old}\n", raw), f"head\n{block}")
+        desc = f"head\n\n{block}\ntail"
+        self.assertIs(replace_contract_block(desc, raw), desc)
+
+    def test_update_contract(self) -> None:
+        desc = "hello\n\n```wg-contract\nschema = 1\nmode = \"core\"\nobjective = \"x\"\ntouch = []\n```\n\ntail\n"
+        new_desc, raw = update_contract(desc, {"touch": ["src/**"]})
+        self.assertEqual(raw, {"schema": 1, "mode": "core", "objective": "x", "touch": ["src/**"]})
+        self.assertEqual(parse_contract(extract_contract(new_desc) or ""), raw)
+        self.assertTrue(new_desc.endswith("\n\ntail\n"))
+
+        new_desc, raw = update_contract("notes", {"touch": ["a/**"]}, defaults={"schema": 1, "mode": "core"})
+        self.assertEqual(raw, {"schema": 1, "mode": "core", "touch": ["a/**"]})
+        self.assertTrue(new_desc.endswith("\nnotes"))
+
+    def test_default_block_matches_generic_renderer(self) -> None:
+        block = format_default_contract_block(mode="harden", objective='fix "x"', touch=["src/**"])
+        expected = render_contract_block(
+            {
+                "schema": 1,
+                "mode": "harden",
+                "objective": 'fix "x"',
+                "non_goals": DEFAULT_NON_GOALS,
+                "touch": ["src/**"],
+                "acceptance": [],
+                "max_files": 25,
+                "max_loc": 800,
+                "pit_stop_after": 3,
+                "auto_followups": True,
+            }
+        )
+        self.assertEqual(block, expected)
+
+    def test_default_contract_raw_is_read_only(self) -> None:
+        with self.assertRaises(TypeError):
+            DEFAULT_CONTRACT_RAW["max_files"] = 1  # type: ignore[index]
+        new_desc, _ = update_contract("", {"touch": ["src/**"]}, defaults={**DEFAULT_CONTRACT_RAW, "objective": "x"})
+        self.assertEqual(new_desc, format_default_contract_block(objective="x", touch=["src/**"]))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,71 @@
+import os
+import unittest
+
+from tests.support import TempDirTestCase
+from wg_drift.events import EventTail
+
+
+class EventTailTests(TempDirTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.path = self.tmp / "events.jsonl"
+
+    def _append(self, text: str) -> None:
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(text)
+
+    def test_appends_across_polls(self) -> None:
+        with EventTail(self.path) as tail:
+            self.assertEqual(tail.read_since(0), ([], 0))
+
+            self._append('{"n":1}\n')
+            events, cursor = tail.read_since(0)
+            self.assertEqual(events, [{"n": 1}])
+
+            self._append('{"n":2}\nnot json\n{"n":3}\n')
+            events, cursor = tail.read_since(cursor)
+            self.assertEqual(events, [{"n": 2}, {"n": 3}])
+            self.assertEqual(cursor, self.path.stat().st_size)
+
+            self.assertEqual(tail.read_since(cursor), ([], cursor))
+
+    def test_partial_line_held_back(self) -> None:
+        with EventTail(self.path) as tail:
+            self._append('{"n":1}\n{"n":')
+            events, cursor = tail.read_since(0)
+            self.assertEqual(events, [{"n": 1}])
+            self.assertEqual(cursor, len('{"n":1}\n'))
+
+            self._append("2}\n")
+            events, cursor = tail.read_since(cursor)
+            self.assertEqual(events, [{"n": 2}])
+            self.assertEqual(cursor, self.path.stat().st_size)
+
+    def test_truncation_restarts_at_zero(self) -> None:
+        with EventTail(self.path) as tail:
+            self._append('{"n":1}\n{"n":2}\n')
+            _, cursor = tail.read_since(0)
+
+            with self.path.open("w", encoding="utf-8") as f:
+                f.write('{"n":3}\n')
+            events, cursor = tail.read_since(cursor)
+            self.assertEqual(events, [{"n": 3}])
+            self.assertEqual(cursor, len('{"n":3}\n'))
+
+    def test_rotation_reopens(self) -> None:
+        with EventTail(self.path) as tail:
+            self._append('{"n":1}\n')
+            _, cursor = tail.read_since(0)
+
+            rotated = self.path.with_name("events.new")
+            rotated.write_text('{"n":1}\n{"n":2}\n', encoding="utf-8")
+            os.replace(rotated, self.path)
+            events, _ = tail.read_since(cursor)
+            self.assertEqual(events, [{"n": 2}])
+
+            self.path.unlink()
+            self.assertEqual(tail.read_since(cursor), ([], cursor))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+
+from tests.support import TempDirTestCase
+from wg_drift.fs_tools import atomic_writer
+
+
+class AtomicWriterTests(TempDirTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.dir = self.tmp
+        self.path = self.dir / "state.json"
+
+    def test_replaces_target(self) -> None:
+        self.path.write_text("old\n", encoding="utf-8")
+        with atomic_writer(self.path) as f:
+            f.write("new\n")
+        self.assertEqual(self.path.read_text(encoding="utf-8"), "new\n")
+        self.assertEqual([p.name for p in self.dir.iterdir()], ["state.json"])
+
+    def test_error_keeps_target_and_removes_temp(self) -> None:
+        self.path.write_text("old\n", encoding="utf-8")
+        with self.assertRaises(RuntimeError):
+            with atomic_writer(self.path) as f:
+                f.write("partial")
+                raise RuntimeError("boom")
+        self.assertEqual(self.path.read_text(encoding="utf-8"), "old\n")
+        self.assertEqual([p.name for p in self.dir.iterdir()], ["state.json"])
+
+    def test_concurrent_writers_use_distinct_temps(self) -> None:
+        with atomic_writer(self.path) as a, atomic_writer(self.path) as b:
+            self.assertEqual(len(list(self.dir.glob(".state.json.*.tmp"))), 2)
+            a.write("a\n")
+            b.write("b\n")
+        # Last rename wins; neither writer's temp file is left behind.
+        self.assertEqual(self.path.read_text(encoding="utf-8"), "a\n")
+        self.assertEqual([p.name for p in self.dir.iterdir()], ["state.json"])
+
+
+if __name__ == "__main__":
+    unittest.main()
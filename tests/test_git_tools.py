@@ -0,0 +1,46 @@
+import unittest
+
+from wg_drift.git_tools import _git_status_v2
+
+
+class GitStatusV2Tests(unittest.TestCase):
+    def test_entries(self) -> None:
+        out = "\0".join(
+            [
+                "# branch.oid 1111111111111111111111111111111111111111",
+                "# branch.head main",
+                "1 .M N... 100644 100644 100644 aaaa aaaa src/app.py",
+                "1 A. N... 000000 100644 100644 0000 bbbb docs/new file.md",
+                "2 R. N... 100644 100644 100644 cccc cccc R100 src/new name.py",
+                "src/old name.py",
+                "u UU N... 100644 100644 100644 100644 dddd eeee ffff conflict.txt",
+                "? notes/todo.txt",
+                "! build/out.o",
+                "",
+            ]
+        )
+        entries, has_head = _git_status_v2(out)
+        self.assertTrue(has_head)
+        self.assertEqual(
+            entries,
+            [
+                ("src/app.py", ".M"),
+                ("docs/new file.md", "A."),
+                ("src/new name.py", "R."),
+                ("conflict.txt", "UU"),
+                ("notes/todo.txt", "??"),
+            ],
+        )
+
+    def test_copy_skips_original_path(self) -> None:
+        out = "2 C. N... 100644 100644 100644 aaaa aaaa C75 b.py\0a.py\0? c.py\0"
+        self.assertEqual(_git_status_v2(out), ([("b.py", "C."), ("c.py", "??")], True))
+
+    def test_initial_commit(self) -> None:
+        out = "# branch.oid (initial)\0# branch.head main\0? a.py\0"
+        self.assertEqual(_git_status_v2(out), ([("a.py", "??")], False))
+        self.assertEqual(_git_status_v2(""), ([], True))
+
+
+if __name__ == "__main__":
+    unittest.main()
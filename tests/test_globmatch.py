@@ -1,6 +1,6 @@
 import unittest
 
-from wg_drift.globmatch import match_any, match_path
+from wg_drift.globmatch import match_any, match_any_batch, match_path
 
 
 class GlobMatchTests(unittest.TestCase):
@@ -19,6 +19,12 @@ class GlobMatchTests(unittest.TestCase):
         self.assertTrue(match_any("docs/readme.md", ["src/**", "docs/**"]))
         self.assertFalse(match_any("docs/readme.md", ["src/**"]))
 
+    def test_match_any_batch(self) -> None:
+        paths = ["docs/readme.md", "src/app/main.py", "setup.py", "a/b/c.md"]
+        patterns = ["src/**", "**/*.md"]
+        self.assertEqual(match_any_batch(paths, patterns), [match_any(p, patterns) for p in paths])
+        self.assertEqual(match_any_batch(paths, []), [False] * len(paths))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+
+from tests.support import TempDirTestCase
+from wg_drift.install import _ensure_line_in_file
+
+
+class EnsureLineTests(TempDirTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.path = self.tmp / ".gitignore"
+
+    def test_appends_after_missing_trailing_newline(self) -> None:
+        self.path.write_bytes(b"a\nb")
+        self.assertTrue(_ensure_line_in_file(self.path, ".coredrift/"))
+        self.assertEqual(self.path.read_bytes(), b"a\nb\n.coredrift/\n")
+
+    def test_line_already_present(self) -> None:
+        for data in (b".coredrift/", b".coredrift/\nb\n", b"a\n.coredrift/", b"a\n  .coredrift/  \nb"):
+            self.path.write_bytes(data)
+            self.assertFalse(_ensure_line_in_file(self.path, ".coredrift/"))
+            self.assertEqual(self.path.read_bytes(), data)
+
+    def test_missing_file_and_trailing_blank_lines(self) -> None:
+        self.assertTrue(_ensure_line_in_file(self.path, "x"))
+        self.assertEqual(self.path.read_bytes(), b"x\n")
+        self.path.write_bytes(b"a\n\n\n")
+        self.assertTrue(_ensure_line_in_file(self.path, "x"))
+        self.assertEqual(self.path.read_bytes(), b"a\nx\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import os
+import unittest
+
+from tests.support import TempDirTestCase
+from wg_drift.state import load_state, save_state, state_path
+
+
+class StateCacheTests(TempDirTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.wg_dir = self.tmp
+
+    def test_external_rewrite_same_size_and_mtime(self) -> None:
+        save_state(self.wg_dir, {"schema": 1, "tasks": {}, "event_cursor": 1})
+        self.assertEqual(load_state(self.wg_dir)["event_cursor"], 1)
+
+        # Another process rewrites the file in place: same inode, same size, same mtime.
+        p = state_path(self.wg_dir)
+        st = p.stat()
+        head, _, tail = p.read_text(encoding="utf-8").rpartition("1")
+        p.write_text(head + "2" + tail, encoding="utf-8")
+        os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns))
+        self.assertEqual(p.stat().st_size, st.st_size)
+
+        self.assertEqual(load_state(self.wg_dir)["event_cursor"], 2)
+
+    def test_old_file_reads_back_unchanged(self) -> None:
+        save_state(self.wg_dir, {"schema": 1, "tasks": {}, "event_cursor": 3})
+        p = state_path(self.wg_dir)
+        os.utime(p, ns=(0, 0))
+        self.assertEqual(load_state(self.wg_dir)["event_cursor"], 3)
+        self.assertEqual(load_state(self.wg_dir)["event_cursor"], 3)
+
+    def test_unchanged_save_skips_write(self) -> None:
+        state = {"schema": 1, "tasks": {}, "event_cursor": 4}
+        save_state(self.wg_dir, state)
+        p = state_path(self.wg_dir)
+        ino = p.stat().st_ino
+        save_state(self.wg_dir, state)
+        # A rewrite would have renamed a new temp file (a new inode) over the old one.
+        self.assertEqual(p.stat().st_ino, ino)
+
+    def test_save_after_external_change_writes(self) -> None:
+        state = {"schema": 1, "tasks": {}, "event_cursor": 5}
+        save_state(self.wg_dir, state)
+        load_state(self.wg_dir)
+        p = state_path(self.wg_dir)
+        st = p.stat()
+        ours = p.read_text(encoding="utf-8")
+        head, _, tail = ours.rpartition("5")
+        p.write_text(head + "6" + tail, encoding="utf-8")
+        os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        save_state(self.wg_dir, state)
+        self.assertEqual(p.read_text(encoding="utf-8"), ours)
+
+
+if __name__ == "__main__":
+    unittest.main()
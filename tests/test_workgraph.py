@@ -0,0 +1,68 @@
+import json
+import unittest
+from unittest import mock
+
+from tests.support import TempDirTestCase
+from wg_drift import workgraph
+from wg_drift.workgraph import update_task_description, update_task_descriptions
+
+_GRAPH = (
+    '{"kind": "task", "id": "a", "title": "A", "description": "old a", "tags": ["x"]}\n'
+    '{"kind":"task","id":"b","description":"old b"}\n'
+    '{"kind": "task", "id": "c", "description": "caf\\u00e9"}\n'
+    '{"kind": "log", "task": "a",  "message": "hi"}\n'
+)
+
+
+class UpdateTaskDescriptionsTests(TempDirTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.wg_dir = self.tmp
+        self.graph = self.wg_dir / "graph.jsonl"
+        self.graph.write_text(_GRAPH, encoding="utf-8")
+
+    def test_batch_lands_in_one_write(self) -> None:
+        with mock.patch.object(workgraph, "_write_graph_lines", wraps=workgraph._write_graph_lines) as write:
+            res = update_task_descriptions(wg_dir=self.wg_dir, updates={"a": 'new "a"', "b": "new b"})
+        self.assertTrue(res.updated)
+        self.assertEqual(write.call_count, 1)
+
+        old_lines = _GRAPH.splitlines()
+        new_lines = self.graph.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(
+            new_lines[0],
+            '{"kind": "task", "id": "a", "title": "A", "description": "new \\"a\\"", "tags": ["x"]}',
+        )
+        self.assertEqual(new_lines[1], '{"kind":"task","id":"b","description":"new b"}')
+        # Only the description value is re-encoded; lines that were not updated keep
+        # their exact bytes (spacing, escapes).
+        self.assertEqual(new_lines[2:], old_lines[2:])
+
+    def test_single_update(self) -> None:
+        res = update_task_description(wg_dir=self.wg_dir, task_id="c", new_description="tea")
+        self.assertTrue(res.updated)
+        new_lines = self.graph.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(new_lines[2], '{"kind": "task", "id": "c", "description": "tea"}')
+        self.assertEqual(new_lines[:2] + new_lines[3:], _GRAPH.splitlines()[:2] + _GRAPH.splitlines()[3:])
+
+    def test_ambiguous_key_falls_back_to_reencoding(self) -> None:
+        line = '{"kind": "task", "id": "d", "meta": {"description": "m"}, "description": "old"}'
+        self.graph.write_text(line + "\n", encoding="utf-8")
+        update_task_description(wg_dir=self.wg_dir, task_id="d", new_description="new")
+        obj = json.loads(line)
+        obj["description"] = "new"
+        self.assertEqual(self.graph.read_text(encoding="utf-8"), json.dumps(obj, separators=(",", ":")) + "\n")
+
+    def test_missing_task_leaves_graph_untouched(self) -> None:
+        with self.assertRaises(ValueError):
+            update_task_descriptions(wg_dir=self.wg_dir, updates={"a": "new a", "zz": "nope"})
+        self.assertEqual(self.graph.read_text(encoding="utf-8"), _GRAPH)
+        self.assertEqual([p.name for p in self.wg_dir.iterdir()], ["graph.jsonl"])
+
+    def test_no_updates_is_a_no_op(self) -> None:
+        self.assertFalse(update_task_descriptions(wg_dir=self.wg_dir, updates={}).updated)
+        self.assertEqual(self.graph.read_text(encoding="utf-8"), _GRAPH)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import os
 import shutil
+import subprocess
 import sys
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Iterable
@@ -12,22 +15,11 @@ from typing import Any, Iterable
 from wg_drift.contracts import (
     CONTRACT_FENCE_INFO,
     TaskContract,
-    DEFAULT_NON_GOALS,
+    DEFAULT_CONTRACT_RAW,
     extract_contract,
     format_default_contract_block,
     parse_contract,
-    replace_contract_block,
-)
-from wg_drift.drift import compute_drift
-from wg_drift.events import append_event, events_path, read_events_since
-from wg_drift.git_tools import get_git_root, get_working_changes
-from wg_drift.install import (
-    ensure_executor_guidance,
-    ensure_coredrift_gitignore,
-    ensure_uxdrift_gitignore,
-    write_drifts_wrapper,
-    write_coredrift_wrapper,
-    write_uxdrift_wrapper,
+    update_contract,
 )
 from wg_drift.state import locked_state, mark_pit_stop_created, update_task_state
 from wg_drift.workgraph import (
@@ -47,7 +39,9 @@ class ExitCode:
     error: int = 1
 
 
-def _parse_args(argv: list[str]) -> argparse.Namespace:
+@functools.lru_cache(maxsize=1)
+def _get_parser() -> argparse.ArgumentParser:
+    # Built once per process; the parser holds no per-invocation state.
     p = argparse.ArgumentParser(prog="coredrift", add_help=True)
     p.add_argument("--dir", help="Path to .workgraph directory (default: search upward from cwd)")
 
@@ -118,11 +112,30 @@ def _parse_args(argv: list[str]) -> argparse.Namespace:
     c_touch.add_argument("--task", help="Task id")
     c_touch.add_argument("touch", nargs="+", help="Repo-root-relative glob(s), e.g. src/** **/*.md")
 
-    return p.parse_args(argv)
+    return p
+
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    return _get_parser().parse_args(argv)
+
+
+def _tasks_with_status(wg: Workgraph, status: str) -> list[dict[str, Any]]:
+    return [t for t in wg.tasks.values() if t.get("status") == status]
+
+
+@functools.cache
+def _repo_root() -> Path:
+    return Path(__file__).resolve().parents[1]
+
+
+@functools.cache
+def _coredrift_bin_path() -> Path:
+    # Checkout-local launcher; install falls back to PATH when it does not exist.
+    return (_repo_root() / "bin" / "coredrift").resolve()
 
 
 def _choose_task_id(wg: Workgraph) -> str:
-    in_progress = [t for t in wg.tasks.values() if t.get("status") == "in-progress"]
+    in_progress = _tasks_with_status(wg, "in-progress")
     if len(in_progress) == 1:
         return str(in_progress[0]["id"])
     if not in_progress:
@@ -130,29 +143,32 @@ def _choose_task_id(wg: Workgraph) -> str:
     raise ValueError(f"Multiple in-progress tasks found ({len(in_progress)}); pass --task <id>.")
 
 
-def _emit_text(report: dict[str, Any]) -> None:
+def _format_text(report: dict[str, Any]) -> str:
     task_id = report.get("task_id")
     title = report.get("task_title")
     score = report.get("score")
     findings = report.get("findings", [])
 
-    print(f"{task_id}: {title}")
-    print(f"score: {score}")
+    lines = [f"{task_id}: {title}", f"score: {score}"]
     if not findings:
-        print("findings: none")
-        return
+        lines.append("findings: none")
+    else:
+        lines.append("findings:")
+        for f in findings:
+            kind = f.get("kind")
+            sev = f.get("severity")
+            summary = f.get("summary")
+            lines.append(f"- [{sev}] {kind}: {summary}")
+    return "\n".join(lines) + "\n"
 
-    print("findings:")
-    for f in findings:
-        kind = f.get("kind")
-        sev = f.get("severity")
-        summary = f.get("summary")
-        print(f"- [{sev}] {kind}: {summary}")
+
+def _emit_text(report: dict[str, Any]) -> None:
+    sys.stdout.write(_format_text(report))
 
 
 def _emit_json(obj: Any) -> None:
-    json.dump(obj, sys.stdout, indent=2, sort_keys=False)
-    sys.stdout.write("\n")
+    # One write of the whole document rather than json.dump's per-chunk writes.
+    sys.stdout.write(json.dumps(obj, indent=2, sort_keys=False) + "\n")
 
 
 def _maybe_write_log(wg: Workgraph, task_id: str, report: dict[str, Any]) -> None:
@@ -174,25 +190,31 @@ def _maybe_write_log(wg: Workgraph, task_id: str, report: dict[str, Any]) -> Non
 
 
 def _maybe_create_followups(wg: Workgraph, report: dict[str, Any]) -> None:
-    task_id = str(report["task_id"])
-    task_title = str(report.get("task_title") or task_id)
     contract = report.get("contract") or {}
-    mode = contract.get("mode", "core")
-    if contract.get("auto_followups", True) is False:
+    if contract.get("mode", "core") != "core":
         return
-
-    if mode != "core":
+    if contract.get("auto_followups", True) is False:
         return
 
     findings = report.get("findings", [])
     if not findings:
         return
 
-    # Create a small number of deterministic follow-ups.
+    task_id = str(report["task_id"])
+    task_title = str(report.get("task_title") or task_id)
+
+    # Create a small number of deterministic follow-ups. Each kind maps to one task id,
+    # so only its first finding matters, and ids already in the graph need no `wg add`
+    # (nor a rendered description).
+    first_by_kind: dict[str, dict[str, Any]] = {}
     for f in findings:
-        kind = str(f.get("kind") or "")
+        first_by_kind.setdefault(str(f.get("kind") or ""), f)
+
+    for kind, f in first_by_kind.items():
         if kind == "hardening_in_core":
             follow_id = f"drift-harden-{task_id}"
+            if follow_id in wg.tasks:
+                continue
             title = f"harden: {task_title}"
             desc = (
                 "Move guardrails/fallbacks out of core execution.\n\n"
@@ -210,6 +232,8 @@ def _maybe_create_followups(wg: Workgraph, report: dict[str, Any]) -> None:
             )
         elif kind == "scope_drift":
             follow_id = f"drift-scope-{task_id}"
+            if follow_id in wg.tasks:
+                continue
             title = f"scope: {task_title}"
             desc = (
                 "Triage out-of-scope file changes (update contract touch set or revert).\n\n"
@@ -227,16 +251,17 @@ def _maybe_create_followups(wg: Workgraph, report: dict[str, Any]) -> None:
             )
 
 def _maybe_create_pit_stop(wg: Workgraph, report: dict[str, Any], *, streak: int) -> str | None:
-    task_id = str(report["task_id"])
-    task_title = str(report.get("task_title") or task_id)
     contract = report.get("contract") or {}
-    mode = contract.get("mode", "core")
-    if contract.get("auto_followups", True) is False:
+    if contract.get("mode", "core") != "core":
         return None
-    if mode != "core":
+    if contract.get("auto_followups", True) is False:
         return None
 
+    task_id = str(report["task_id"])
+    task_title = str(report.get("task_title") or task_id)
     pit_id = f"coredrift-pit-{task_id}"
+    if pit_id in wg.tasks:
+        return pit_id
     title = f"pit-stop: {task_title}"
 
     findings = report.get("findings", [])
@@ -272,24 +297,66 @@ def _maybe_create_pit_stop(wg: Workgraph, report: dict[str, Any], *, streak: int
     return pit_id
 
 
-def _report_for_task(wg: Workgraph, task_id: str) -> dict[str, Any]:
+@functools.lru_cache(maxsize=512)
+def _parse_description(
+    description: str, fallback_objective: str
+) -> tuple[str | None, dict[str, Any] | None, TaskContract | None, str | None]:
+    """
+    extract -> parse -> TaskContract for a task description, cached because the polling
+    loops see the same unchanged descriptions every tick.
+
+    Returns (contract_text, raw, contract, error). raw is None if parsing failed; error
+    is the first parse/validation failure. The raw dict is shared: do not mutate it.
+    """
+
+    contract_text = extract_contract(description)
+    if contract_text is None:
+        return (None, None, None, None)
+    try:
+        raw = parse_contract(contract_text)
+    except Exception as e:
+        return (contract_text, None, None, str(e))
+    try:
+        return (contract_text, raw, TaskContract.from_raw(raw, fallback_objective=fallback_objective), None)
+    except Exception as e:
+        return (contract_text, raw, None, str(e))
+
+
+def _report_kinds(report: dict[str, Any]) -> list[str]:
+    kinds = report.get("kinds")
+    if isinstance(kinds, list):
+        return kinds
+    # Reports from older events predate the precomputed field.
+    return sorted({str(f.get("kind")) for f in report.get("findings", [])})
+
+
+def _git_snapshot(wg: Workgraph) -> tuple[str | None, Any]:
+    """
+    (git_root, working changes) for the project. The working tree is the same for
+    every task, so loops take one snapshot per tick and share it.
+    """
+
+    from wg_drift.git_tools import get_git_root, get_working_changes
+
+    git_root = get_git_root(wg.project_dir)
+    return (git_root, get_working_changes(git_root) if git_root else None)
+
+
+def _report_for_task(
+    wg: Workgraph, task_id: str, *, snapshot: tuple[str | None, Any] | None = None
+) -> dict[str, Any]:
     task = wg.tasks.get(task_id)
     if not task:
         raise ValueError(f"Task not found: {task_id}")
 
     description = str(task.get("description") or "")
-    contract_text = extract_contract(description)
-    contract: TaskContract | None = None
-    contract_raw: dict[str, Any] | None = None
-    if contract_text is not None:
-        try:
-            contract_raw = parse_contract(contract_text)
-            contract = TaskContract.from_raw(contract_raw, fallback_objective=str(task.get("title") or task_id))
-        except Exception as e:
-            contract_raw = {"parse_error": str(e)}
+    _, contract_raw, contract, error = _parse_description(description, str(task.get("title") or task_id))
+    if error is not None:
+        contract_raw = {"parse_error": error}
 
-    git_root = get_git_root(wg.project_dir)
-    changes = get_working_changes(git_root) if git_root else None
+    from wg_drift.drift import compute_drift
+
+    git_root, changes = snapshot if snapshot is not None else _git_snapshot(wg)
 
     return compute_drift(
         task_id=task_id,
@@ -302,21 +369,85 @@ def _report_for_task(wg: Workgraph, task_id: str) -> dict[str, Any]:
     )
 
 
+# wg_dir -> (graph.jsonl mtime_ns, size, loaded graph, its in-progress tasks) for the
+# polling loops. The task list lives and dies with the graph it was computed from.
+_WG_CACHE: dict[Path, tuple[int, int, Workgraph, list[dict[str, Any]]]] = {}
+
+
+def _cached_load_workgraph(wg_dir: Path) -> tuple[Workgraph, list[dict[str, Any]]]:
+    """
+    load_workgraph plus the graph's in-progress tasks, both skipped when graph.jsonl is
+    unchanged (same mtime_ns and size) since the previous call for this directory.
+    """
+
+    try:
+        st = (wg_dir / "graph.jsonl").stat()
+    except FileNotFoundError:
+        _WG_CACHE.pop(wg_dir, None)
+        wg = load_workgraph(wg_dir)
+        return (wg, _tasks_with_status(wg, "in-progress"))
+    hit = _WG_CACHE.get(wg_dir)
+    if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        return (hit[2], hit[3])
+    wg = load_workgraph(wg_dir)
+    in_progress = _tasks_with_status(wg, "in-progress")
+    _WG_CACHE[wg_dir] = (st.st_mtime_ns, st.st_size, wg, in_progress)
+    return (wg, in_progress)
+
+
+def _file_sig(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _wait_for_change(paths: list[Path], timeout: float, *, poll: float | None = None) -> None:
+    """
+    Sleeps until one of `paths` changes (mtime/size) or `timeout` elapses.
+
+    A stat per path every `poll` seconds keeps this dependency-free (no inotify/kqueue).
+    The default poll is a tenth of the timeout (at least 1s): about ten wakeups per
+    interval bound the idle cost, and a change is picked up within that slice instead
+    of after the full interval.
+    """
+
+    if poll is None:
+        poll = max(1.0, timeout / 10)
+    deadline = time.monotonic() + timeout
+    before = [_file_sig(p) for p in paths]
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        time.sleep(min(poll, remaining))
+        if [_file_sig(p) for p in paths] != before:
+            return
+
+
 def main(argv: list[str] | None = None) -> int:
     args = _parse_args(sys.argv[1:] if argv is None else argv)
 
     try:
         if args.cmd == "install":
+            from wg_drift.install import (
+                ensure_executor_guidance,
+                ensure_coredrift_gitignore,
+                ensure_uxdrift_gitignore,
+                write_drifts_wrapper,
+                write_coredrift_wrapper,
+                write_uxdrift_wrapper,
+            )
+
             # Resolve or initialize workgraph directory.
             base = Path(args.dir).expanduser() if args.dir else Path.cwd()
             wg_dir = base if base.name == ".workgraph" else base / ".workgraph"
             if not (wg_dir / "graph.jsonl").exists():
-                import subprocess
-
                 subprocess.check_call(["wg", "init", "--dir", str(wg_dir)])
 
             # Create wrapper and guidance in the target project.
-            coredrift_bin = (Path(__file__).resolve().parents[1] / "bin" / "coredrift").resolve()
+            coredrift_bin = _coredrift_bin_path()
             if not coredrift_bin.exists():
                 which = shutil.which("coredrift")
                 if not which:
@@ -341,20 +472,16 @@ def main(argv: list[str] | None = None) -> int:
                     candidates.append(Path(env_bin).expanduser())
 
                 # Convenience for "side-by-side" checkouts (common in this workspace).
-                repo_root = Path(__file__).resolve().parents[1]
-                candidates.append(repo_root.parent / "uxdrift" / "bin" / "uxdrift")
+                candidates.append(_repo_root().parent / "uxdrift" / "bin" / "uxdrift")
 
                 which = shutil.which("uxdrift")
                 if which:
                     candidates.append(Path(which))
 
                 for c in candidates:
-                    try:
-                        resolved = c.resolve()
-                    except Exception:
-                        resolved = c
-                    if resolved.exists() and os.access(resolved, os.X_OK):
-                        uxdrift_bin = resolved
+                    # exists()/access() follow symlinks, so only the winner needs resolving.
+                    if c.exists() and os.access(c, os.X_OK):
+                        uxdrift_bin = c.resolve()
                         include_uxdrift = True
                         break
 
@@ -406,19 +533,17 @@ def main(argv: list[str] | None = None) -> int:
             if not task:
                 raise ValueError(f"Task not found: {task_id}")
             description = str(task.get("description") or "")
-            contract_text = extract_contract(description)
 
             if args.contract_cmd == "show":
+                contract_text, raw, _, error = _parse_description(description, str(task.get("title") or task_id))
                 if contract_text is None:
                     if args.json:
                         _emit_json({"task_id": task_id, "contract": None})
                     else:
                         print(f"{task_id}: (no contract)")
                     return ExitCode.ok
-                try:
-                    raw = parse_contract(contract_text)
-                except Exception as e:
-                    raw = {"parse_error": str(e)}
+                if raw is None:
+                    raw = {"parse_error": error}
                 if args.json:
                     _emit_json({"task_id": task_id, "contract": raw})
                 else:
@@ -428,124 +553,106 @@ def main(argv: list[str] | None = None) -> int:
 
             if args.contract_cmd == "set-touch":
                 title = str(task.get("title") or task_id)
-                raw: dict[str, Any]
-                if contract_text is None:
-                    raw = {
-                        "schema": 1,
-                        "mode": "core",
-                        "objective": title,
-                        "non_goals": DEFAULT_NON_GOALS,
-                        "touch": [],
-                        "acceptance": [],
-                        "max_files": 25,
-                        "max_loc": 800,
-                        "pit_stop_after": 3,
-                        "auto_followups": True,
-                    }
-                else:
-                    raw = parse_contract(contract_text)
-
-                raw["touch"] = list(args.touch)
-                new_desc = replace_contract_block(description, raw)
-                update_task_description(wg_dir=wg_dir, task_id=task_id, new_description=new_desc)
+                new_desc, _ = update_contract(
+                    description,
+                    {"touch": list(args.touch)},
+                    defaults={**DEFAULT_CONTRACT_RAW, "objective": title},
+                )
+                if new_desc != description:
+                    update_task_description(wg_dir=wg_dir, task_id=task_id, new_description=new_desc)
                 print(f"Updated contract touch for {task_id}: {len(args.touch)} globs")
                 return ExitCode.ok
 
             raise ValueError(f"Unknown contract subcommand: {args.contract_cmd}")
 
         if args.cmd == "monitor":
-            import time
+            from wg_drift.events import append_events
 
             while True:
-                wg = load_workgraph(wg_dir)
+                wg, in_progress = _cached_load_workgraph(wg_dir)
                 if args.task:
                     task_ids = [str(args.task)]
                 else:
-                    task_ids = [str(t["id"]) for t in wg.tasks.values() if t.get("status") == "in-progress"]
+                    task_ids = [str(t["id"]) for t in in_progress]
 
-                for task_id in task_ids:
-                    report = _report_for_task(wg, task_id)
-                    append_event(wg_dir, {"kind": "drift_report", **report})
+                snapshot = _git_snapshot(wg) if task_ids else None
+                append_events(
+                    wg_dir,
+                    [{"kind": "drift_report", **_report_for_task(wg, tid, snapshot=snapshot)} for tid in task_ids],
+                )
 
                 if args.once:
                     return ExitCode.ok
-                time.sleep(max(1, int(args.interval)))
+                _wait_for_change([wg_dir / "graph.jsonl"], max(1, int(args.interval)))
 
         if args.cmd == "redirect":
-            import time
+            from wg_drift.events import EventTail, events_path
 
             p = events_path(wg_dir)
             from_start = bool(args.from_start)
 
-            while True:
-                wg = load_workgraph(wg_dir)
-                with locked_state(wg_dir) as state:
-                    cursor = 0 if from_start else int(state.get("event_cursor") or 0)
-                    events, new_cursor = read_events_since(p, cursor)
-
-                    if not events:
-                        # Still persist cursor if file got truncated.
-                        state["event_cursor"] = cursor
+            with EventTail(p) as tail:
+                while True:
+                    wg, _ = _cached_load_workgraph(wg_dir)
+                    # One critical section per tick: cursor read, event handling, cursor write.
+                    with locked_state(wg_dir) as state:
+                        cursor = 0 if from_start else int(state.get("event_cursor") or 0)
+                        events, new_cursor = tail.read_since(cursor)
+
+                        if not events:
+                            # Still persist cursor if file got truncated.
+                            new_cursor = cursor
+                        else:
+                            from_start = False
+
+                        for ev in events:
+                            if not isinstance(ev, dict):
+                                continue
+                            if ev.get("kind") not in (None, "drift_report"):
+                                continue
+                            report = ev.get("report") if isinstance(ev.get("report"), dict) else ev
+                            task_id = report.get("task_id")
+                            if not task_id:
+                                continue
+                            task_id = str(task_id)
+
+                            kinds = _report_kinds(report)
+                            prev = (
+                                ((state.get("tasks") or {}).get(task_id) or {}) if isinstance(state.get("tasks"), dict) else {}
+                            )
+                            prev_sig = (str(prev.get("score") or "green"), tuple(prev.get("kinds") or ()))
+                            cur_sig = (str(report.get("score") or "green"), tuple(kinds))
+
+                            contract = report.get("contract") or {}
+                            pit_stop_after = int(contract.get("pit_stop_after") or 3)
+
+                            upd = update_task_state(
+                                state=state,
+                                task_id=task_id,
+                                score=str(report.get("score")),
+                                kinds=kinds,
+                                pit_stop_after=pit_stop_after,
+                            )
+
+                            sig_changed = prev_sig != cur_sig
+                            if args.write_log and (sig_changed or upd.pit_stop_due):
+                                _maybe_write_log(wg, task_id, report)
+
+                            if args.create_followups and (sig_changed or upd.pit_stop_due):
+                                _maybe_create_followups(wg, report)
+                                if upd.pit_stop_due:
+                                    pit_id = _maybe_create_pit_stop(wg, report, streak=upd.streak)
+                                    if pit_id:
+                                        mark_pit_stop_created(state=state, task_id=task_id)
+
+                        state["event_cursor"] = int(new_cursor)
 
-                if not events:
                     if args.once:
                         return ExitCode.ok
-                    time.sleep(max(1, int(args.interval)))
-                    continue
-
-                from_start = False
-
-                with locked_state(wg_dir) as state:
-                    for ev in events:
-                        if not isinstance(ev, dict):
-                            continue
-                        if ev.get("kind") not in (None, "drift_report"):
-                            continue
-                        report = ev.get("report") if isinstance(ev.get("report"), dict) else ev
-                        task_id = report.get("task_id")
-                        if not task_id:
-                            continue
-                        task_id = str(task_id)
-
-                        kinds = sorted({str(f.get("kind")) for f in report.get("findings", [])})
-                        prev = (
-                            ((state.get("tasks") or {}).get(task_id) or {}) if isinstance(state.get("tasks"), dict) else {}
-                        )
-                        prev_sig = (str(prev.get("score") or "green"), tuple(prev.get("kinds") or ()))
-                        cur_sig = (str(report.get("score") or "green"), tuple(kinds))
-
-                        contract = report.get("contract") or {}
-                        pit_stop_after = int(contract.get("pit_stop_after") or 3)
-
-                        upd = update_task_state(
-                            state=state,
-                            task_id=task_id,
-                            score=str(report.get("score")),
-                            kinds=kinds,
-                            pit_stop_after=pit_stop_after,
-                        )
-
-                        sig_changed = prev_sig != cur_sig
-                        if args.write_log and (sig_changed or upd.pit_stop_due):
-                            _maybe_write_log(wg, task_id, report)
-
-                        if args.create_followups and (sig_changed or upd.pit_stop_due):
-                            _maybe_create_followups(wg, report)
-                            if upd.pit_stop_due:
-                                pit_id = _maybe_create_pit_stop(wg, report, streak=upd.streak)
-                                if pit_id:
-                                    mark_pit_stop_created(state=state, task_id=task_id)
-
-                    state["event_cursor"] = int(new_cursor)
-
-                if args.once:
-                    return ExitCode.ok
-                time.sleep(max(1, int(args.interval)))
+                    _wait_for_change([p], max(1, int(args.interval)))
 
         if args.cmd == "orchestrate":
-            import subprocess
-
-            repo_root = Path(__file__).resolve().parents[1]
+            repo_root = _repo_root()
             env = os.environ.copy()
             env["PYTHONPATH"] = str(repo_root) + (os.pathsep + env["PYTHONPATH"] if env.get("PYTHONPATH") else "")
 
@@ -579,20 +686,18 @@ def main(argv: list[str] | None = None) -> int:
             p_mon = subprocess.Popen(monitor_cmd, env=env)
             p_red = subprocess.Popen(redirect_cmd, env=env)
 
+            # Whichever child exits first takes the other down with it.
+            peer = {p_mon.pid: (p_mon, p_red), p_red.pid: (p_red, p_mon)}
             try:
                 while True:
-                    mon_rc = p_mon.poll()
-                    red_rc = p_red.poll()
-                    if mon_rc is not None:
-                        p_red.terminate()
-                        return int(mon_rc)
-                    if red_rc is not None:
-                        p_mon.terminate()
-                        return int(red_rc)
-
-                    import time
-
-                    time.sleep(0.5)
+                    # Block until a child exits rather than polling; Ctrl-C still interrupts.
+                    pid, status = os.waitpid(-1, 0)
+                    if pid not in peer:
+                        continue
+                    done, other = peer[pid]
+                    done.returncode = os.waitstatus_to_exitcode(status)
+                    other.terminate()
+                    return int(done.returncode)
             except KeyboardInterrupt:
                 p_mon.terminate()
                 p_red.terminate()
@@ -605,7 +710,7 @@ def main(argv: list[str] | None = None) -> int:
             with locked_state(wg_dir) as state:
                 contract = report.get("contract") or {}
                 pit_stop_after = int(contract.get("pit_stop_after") or 3)
-                kinds = sorted({str(f.get("kind")) for f in report.get("findings", [])})
+                kinds = _report_kinds(report)
                 upd = update_task_state(
                     state=state,
                     task_id=task_id,
@@ -630,17 +735,18 @@ def main(argv: list[str] | None = None) -> int:
             return ExitCode.drift_found if report.get("findings") else ExitCode.ok
 
         if args.cmd == "scan":
-            in_progress = [t for t in wg.tasks.values() if t.get("status") == "in-progress"]
-            reports = []
+            in_progress = _tasks_with_status(wg, "in-progress")
+            snapshot = _git_snapshot(wg) if in_progress else None
+            # Build reports (git + drift analysis) before taking the state lock; it then
+            # only covers the bookkeeping and follow-up actions.
+            reports = [_report_for_task(wg, str(t["id"]), snapshot=snapshot) for t in in_progress]
             with locked_state(wg_dir) as state:
-                for t in in_progress:
-                    task_id = str(t["id"])
-                    report = _report_for_task(wg, task_id)
-                    reports.append(report)
+                for report in reports:
+                    task_id = str(report["task_id"])
 
                     contract = report.get("contract") or {}
                     pit_stop_after = int(contract.get("pit_stop_after") or 3)
-                    kinds = sorted({str(f.get("kind")) for f in report.get("findings", [])})
+                    kinds = _report_kinds(report)
                     upd = update_task_state(
                         state=state,
                         task_id=task_id,
@@ -661,25 +767,24 @@ def main(argv: list[str] | None = None) -> int:
             if args.json:
                 _emit_json({"reports": reports})
             else:
-                for r in reports:
-                    _emit_text(r)
-                    print()
+                # Reports are separated by a blank line; one write for the whole scan.
+                sys.stdout.write("".join(_format_text(r) + "\n" for r in reports))
             any_findings = any(r.get("findings") for r in reports)
             return ExitCode.drift_found if any_findings else ExitCode.ok
 
         if args.cmd == "watch":
             while True:
                 # Reload each tick so we see new claims/completions without restart.
-                wg = load_workgraph(wg_dir)
-                in_progress = [t for t in wg.tasks.values() if t.get("status") == "in-progress"]
-                reports = []
+                wg, in_progress = _cached_load_workgraph(wg_dir)
+                snapshot = _git_snapshot(wg) if in_progress else None
+                # Build reports (git + drift analysis) before taking the state lock; it then
+                # only covers the bookkeeping and follow-up actions.
+                reports = [_report_for_task(wg, str(t["id"]), snapshot=snapshot) for t in in_progress]
                 with locked_state(wg_dir) as state:
-                    for t in in_progress:
-                        task_id = str(t["id"])
-                        report = _report_for_task(wg, task_id)
-                        reports.append(report)
+                    for report in reports:
+                        task_id = str(report["task_id"])
 
-                        kinds = sorted({str(f.get("kind")) for f in report.get("findings", [])})
+                        kinds = _report_kinds(report)
                         prev = (
                             ((state.get("tasks") or {}).get(task_id) or {}) if isinstance(state.get("tasks"), dict) else {}
                         )
@@ -707,12 +812,10 @@ def main(argv: list[str] | None = None) -> int:
                                 if pit_id:
                                     mark_pit_stop_created(state=state, task_id=task_id)
 
-                    if args.json:
-                        _emit_json({"reports": reports})
-
-                import time
+                if args.json:
+                    _emit_json({"reports": reports})
 
-                time.sleep(max(1, int(args.interval)))
+                _wait_for_change([wg_dir / "graph.jsonl"], max(1, int(args.interval)))
 
         raise ValueError(f"Unknown command: {args.cmd}")
     except KeyboardInterrupt:
@@ -1,33 +1,174 @@
 from __future__ import annotations
 
 import re
-import tomllib
+import sys
 from dataclasses import dataclass
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping, Sequence
 
 CONTRACT_FENCE_INFO = "wg-contract"
 DEFAULT_NON_GOALS = ["No fallbacks/retries/guardrails unless acceptance requires it"]
-
-_FENCE_RE = re.compile(
-    r"```(?P<info>wg-contract)\s*\n(?P<body>.*?)\n```",
-    re.DOTALL,
+# Base for contracts seeded onto tasks; callers fill in objective (and touch) on a copy,
+# e.g. {**DEFAULT_CONTRACT_RAW, "objective": title}. Read-only, with tuple values, since
+# it is shared and the default TOML below is pre-rendered from it.
+DEFAULT_CONTRACT_RAW: Mapping[str, Any] = MappingProxyType(
+    {
+        "schema": 1,
+        "mode": "core",
+        "objective": "",
+        "non_goals": tuple(DEFAULT_NON_GOALS),
+        "touch": (),
+        "acceptance": (),
+        "max_files": 25,
+        "max_loc": 800,
+        "pit_stop_after": 3,
+        "auto_followups": True,
+    }
 )
 
+_FENCE = "```"
+_FENCE_OPEN = _FENCE + CONTRACT_FENCE_INFO
+_FENCE_OPEN_LEN = len(_FENCE_OPEN)
+_FENCE_CLOSE = "\n" + _FENCE
+_FENCE_CLOSE_LEN = len(_FENCE_CLOSE)
+
+def _find_contract(description: str) -> tuple[int, int, int] | None:
+    """
+    Locates the first wg-contract fence with plain str.find scans.
+
+    Returns (fence_start, body_start, body_end); the closing fence starts at body_end.
+    """
+
+    n = len(description)
+    start = description.find(_FENCE_OPEN)
+    while start >= 0:
+        # The opening line may only carry trailing whitespace (possibly blank lines);
+        # like a greedy `\s*\n`, the body starts after the last newline in that run.
+        info_end = start + _FENCE_OPEN_LEN
+        ws_end = info_end
+        while ws_end < n and description[ws_end].isspace():
+            ws_end += 1
+        nl = description.rfind("\n", info_end, ws_end)
+        if nl >= 0:
+            end = description.find(_FENCE_CLOSE, nl + 1)
+            if end >= 0:
+                return (start, nl + 1, end)
+            # The run itself may end in the closing fence (an empty body).
+            prev_nl = description.rfind("\n", info_end, nl)
+            if prev_nl >= 0 and description.startswith(_FENCE, nl + 1):
+                return (start, prev_nl + 1, nl)
+            return None
+        start = description.find(_FENCE_OPEN, start + 1)
+    return None
+
 
 def extract_contract(description: str) -> str | None:
-    m = _FENCE_RE.search(description or "")
-    if not m:
+    span = _find_contract(description or "")
+    if span is None:
         return None
-    return m.group("body").strip()
+    _, body_start, body_end = span
+    return description[body_start:body_end].strip()
+
+
+# Closed subset of TOML emitted by render_contract_toml: bare keys; escape-free basic
+# strings; decimal ints; booleans; string arrays inline or one item per line.
+_BARE_KEY_RE = re.compile(r"[A-Za-z0-9_-]+")
+_SIMPLE_STR = r'"[^"\\\x00-\x08\x0a-\x1f\x7f]*"'
+_SIMPLE_STR_RE = re.compile(_SIMPLE_STR)
+_SIMPLE_INT_RE = re.compile(r"[+-]?(?:0|[1-9][0-9]*)")
+_INLINE_ARRAY_RE = re.compile(rf"\[[ \t]*(?:{_SIMPLE_STR}[ \t]*,[ \t]*)*(?:{_SIMPLE_STR}[ \t]*)?\]")
+_ARRAY_ITEM_RE = re.compile(r'"([^"]*)"')
+
+
+def _parse_simple_value(val: str) -> Any:
+    if _SIMPLE_STR_RE.fullmatch(val):
+        return val[1:-1]
+    if val == "true":
+        return True
+    if val == "false":
+        return False
+    if _SIMPLE_INT_RE.fullmatch(val):
+        return int(val)
+    if _INLINE_ARRAY_RE.fullmatch(val):
+        return _ARRAY_ITEM_RE.findall(val)
+    return None
+
+
+def _parse_simple(contract_text: str) -> dict[str, Any] | None:
+    """
+    Line scanner for the contract subset we render ourselves.
+
+    Returns None for anything outside that subset (comments after values, escapes,
+    tables, dotted keys, ...) so the caller can fall back to a full TOML parse.
+    """
+
+    out: dict[str, Any] = {}
+    lines = contract_text.split("\n")
+    i, n = 0, len(lines)
+    while i < n:
+        line = lines[i].strip(" \t")
+        i += 1
+        if not line or line.startswith("#"):
+            continue
+        key, sep, val = line.partition("=")
+        key = key.strip(" \t")
+        val = val.strip(" \t")
+        if not sep or key in out or not _BARE_KEY_RE.fullmatch(key):
+            return None
+        if val != "[":
+            value = _parse_simple_value(val)
+            if value is None:
+                return None
+            out[key] = value
+            continue
+
+        items: list[str] = []
+        closed = False
+        while i < n:
+            item = lines[i].strip(" \t")
+            i += 1
+            if item == "]":
+                closed = True
+                break
+            if item.endswith(","):
+                item = item[:-1].rstrip(" \t")
+            elif i >= n or lines[i].strip(" \t") != "]":
+                # Only the last item may omit its trailing comma.
+                return None
+            if not _SIMPLE_STR_RE.fullmatch(item):
+                return None
+            items.append(item[1:-1])
+        if not closed:
+            return None
+        out[key] = items
+    return out
 
 
 def parse_contract(contract_text: str) -> dict[str, Any]:
-    data = tomllib.loads(contract_text)
+    data = _parse_simple(contract_text)
+    if data is None:
+        # Only contracts outside the simple subset need the full parser; importing it
+        # lazily keeps it off the startup path of every CLI invocation.
+        import tomllib
+
+        data = tomllib.loads(contract_text)
     if not isinstance(data, dict):
         raise ValueError("Contract must parse to a TOML table/object.")
     return data
 
 
+def _toml_string(s: str) -> str:
+    # Keep it simple: strip quotes/newlines (contracts are meant to be one-liners).
+    s2 = str(s).replace('"', "").replace("\n", " ").strip()
+    return f'"{s2}"'
+
+
+def _toml_list(xs: Sequence[Any]) -> str:
+    # _toml_string inlined: one comprehension instead of a call per element.
+    items = [f'  "{str(x).replace(chr(34), "").replace(chr(10), " ").strip()}",' for x in xs]
+    return "\n".join(["[", *items, "]"])
+
+
 def render_contract_toml(raw: dict[str, Any]) -> str:
     """
     Minimal TOML writer for our contract schema (kept intentionally small).
@@ -35,18 +176,6 @@ def render_contract_toml(raw: dict[str, Any]) -> str:
     This avoids external deps (tomlkit), and is deterministic for diffs.
     """
 
-    def toml_string(s: str) -> str:
-        # Keep it simple: strip quotes/newlines (contracts are meant to be one-liners).
-        s2 = str(s).replace('"', "").replace("\n", " ").strip()
-        return f'"{s2}"'
-
-    def toml_list_str(xs: list[Any]) -> str:
-        out = ["["]
-        for x in xs:
-            out.append(f"  {toml_string(str(x))},")
-        out.append("]")
-        return "\n".join(out)
-
     lines: list[str] = []
 
     # Stable ordering
@@ -54,21 +183,21 @@ def render_contract_toml(raw: dict[str, Any]) -> str:
     lines.append(f"schema = {schema}")
 
     if "mode" in raw:
-        lines.append(f"mode = {toml_string(str(raw['mode']))}")
+        lines.append(f"mode = {_toml_string(str(raw['mode']))}")
     if "objective" in raw:
-        lines.append(f"objective = {toml_string(str(raw['objective']))}")
+        lines.append(f"objective = {_toml_string(str(raw['objective']))}")
 
     non_goals = raw.get("non_goals")
     if non_goals is not None:
-        lines.append(f"non_goals = {toml_list_str(list(non_goals))}")
+        lines.append(f"non_goals = {_toml_list(list(non_goals))}")
 
     touch = raw.get("touch")
     if touch is not None:
-        lines.append(f"touch = {toml_list_str(list(touch))}")
+        lines.append(f"touch = {_toml_list(list(touch))}")
 
     acceptance = raw.get("acceptance")
     if acceptance is not None:
-        lines.append(f"acceptance = {toml_list_str(list(acceptance))}")
+        lines.append(f"acceptance = {_toml_list(list(acceptance))}")
 
     for k in ["max_files", "max_loc", "pit_stop_after"]:
         if k in raw and raw[k] is not None:
@@ -84,7 +213,23 @@ def render_contract_toml(raw: dict[str, Any]) -> str:
 
 
 def render_contract_block(raw: dict[str, Any]) -> str:
-    return f"```{CONTRACT_FENCE_INFO}\n{render_contract_toml(raw)}```\n"
+    return f"{_FENCE_OPEN}\n{render_contract_toml(raw)}{_FENCE}\n"
+
+
+def _splice_contract_block(description: str, span: tuple[int, int, int] | None, raw: dict[str, Any]) -> str:
+    new_block = render_contract_block(raw)
+    if span is not None:
+        start, _, body_end = span
+        block_end = body_end + _FENCE_CLOSE_LEN
+        if not description.startswith("\n") and description[start:block_end] == new_block[:-1]:
+            # Already canonical: hand back the same string so callers can skip writes.
+            return description
+        # Only the text before the fence can lead with newlines; strip that slice rather
+        # than copying the whole result a second time.
+        return description[:start].lstrip("\n") + new_block[:-1] + description[block_end:]
+    if description.strip():
+        return new_block + "\n" + description
+    return new_block
 
 
 def replace_contract_block(description: str, raw: dict[str, Any]) -> str:
@@ -92,12 +237,43 @@ def replace_contract_block(description: str, raw: dict[str, Any]) -> str:
     Replace the first wg-contract fenced block if present; otherwise prepend.
     """
 
-    new_block = render_contract_block(raw)
-    if _FENCE_RE.search(description or ""):
-        return _FENCE_RE.sub(new_block.rstrip("\n"), description or "", count=1).lstrip("\n")
-    if (description or "").strip():
-        return new_block + "\n" + (description or "")
-    return new_block
+    description = description or ""
+    return _splice_contract_block(description, _find_contract(description), raw)
+
+
+def update_contract(
+    description: str,
+    updates: dict[str, Any],
+    *,
+    defaults: dict[str, Any] | None = None,
+) -> tuple[str, dict[str, Any]]:
+    """
+    Merge `updates` into the task's contract and re-render it in one pass.
+
+    The fence is located and parsed once; `defaults` is the base when the description
+    has no contract yet. Returns (new_description, merged_raw).
+    """
+
+    description = description or ""
+    span = _find_contract(description)
+    if span is None:
+        raw = dict(defaults or {})
+    else:
+        raw = parse_contract(description[span[1] : span[2]].strip())
+    raw.update(updates)
+    return (_splice_contract_block(description, span, raw), raw)
+
+
+# The default contract only varies in mode/objective/touch; everything else is
+# rendered once here (must stay in sync with render_contract_toml's ordering).
+_DEFAULT_NON_GOALS_TOML = f"non_goals = {_toml_list(DEFAULT_CONTRACT_RAW['non_goals'])}\n"
+_DEFAULT_TAIL_TOML = (
+    f"acceptance = {_toml_list(DEFAULT_CONTRACT_RAW['acceptance'])}\n"
+    f"max_files = {DEFAULT_CONTRACT_RAW['max_files']}\n"
+    f"max_loc = {DEFAULT_CONTRACT_RAW['max_loc']}\n"
+    f"pit_stop_after = {DEFAULT_CONTRACT_RAW['pit_stop_after']}\n"
+    f"auto_followups = {'true' if DEFAULT_CONTRACT_RAW['auto_followups'] else 'false'}\n"
+)
 
 
 def format_default_contract_block(
@@ -106,25 +282,39 @@ def format_default_contract_block(
     objective: str = "",
     touch: list[str] | None = None,
 ) -> str:
-    touch = touch or []
-    return render_contract_block(
-        {
-            "schema": 1,
-            "mode": mode,
-            "objective": objective,
-            "non_goals": DEFAULT_NON_GOALS,
-            "touch": touch,
-            "acceptance": [],
-            "max_files": 25,
-            "max_loc": 800,
-            "pit_stop_after": 3,
-            "auto_followups": True,
-        }
+    return (
+        f"{_FENCE_OPEN}\n"
+        "schema = 1\n"
+        f"mode = {_toml_string(mode)}\n"
+        f"objective = {_toml_string(objective)}\n"
+        f"{_DEFAULT_NON_GOALS_TOML}"
+        f"touch = {_toml_list(touch or [])}\n"
+        f"{_DEFAULT_TAIL_TOML}"
+        f"{_FENCE}\n"
     )
 
 
-@dataclass(frozen=True)
-class TaskContract:
+def _strlist(xs: Any) -> list[str]:
+    # Parsed contracts already hold list[str]; a plain list() copy of those skips the
+    # per-item str() calls. Always a copy: raw dicts are shared (the CLI caches parses),
+    # so a contract must never alias their lists.
+    if type(xs) is list:
+        for x in xs:
+            if type(x) is not str:
+                break
+        else:
+            return list(xs)
+    return [str(x) for x in (xs or [])]
+
+
+class _HashSlot:
+    # Extra slot for TaskContract's cached hash; kept off the dataclass fields so it
+    # never shows up in asdict()/repr()/eq.
+    __slots__ = ("_hash",)
+
+
+@dataclass(frozen=True, slots=True)
+class TaskContract(_HashSlot):
     schema: int
     mode: str
     objective: str
@@ -136,14 +326,40 @@ class TaskContract:
     pit_stop_after: int | None
     auto_followups: bool
 
+    def __hash__(self) -> int:
+        # The list fields rule out the generated hash. Hash their tuple forms once, on
+        # first use, so repeated set/dict lookups are O(1); contracts are treated as
+        # immutable, lists included.
+        try:
+            return self._hash
+        except AttributeError:
+            pass
+        h = hash(
+            (
+                self.schema,
+                self.mode,
+                self.objective,
+                tuple(self.non_goals),
+                tuple(self.touch),
+                tuple(self.acceptance),
+                self.max_files,
+                self.max_loc,
+                self.pit_stop_after,
+                self.auto_followups,
+            )
+        )
+        object.__setattr__(self, "_hash", h)
+        return h
+
     @staticmethod
     def from_raw(raw: dict[str, Any], *, fallback_objective: str) -> "TaskContract":
         schema = int(raw.get("schema", 1))
         mode = str(raw.get("mode", "core"))
         objective = str(raw.get("objective") or fallback_objective)
-        non_goals = [str(x) for x in (raw.get("non_goals") or [])]
-        touch = [str(x) for x in (raw.get("touch") or [])]
-        acceptance = [str(x) for x in (raw.get("acceptance") or [])]
+        non_goals = _strlist(raw.get("non_goals"))
+        # Touch globs repeat across contracts and key the glob caches; intern them.
+        touch = [sys.intern(str(x)) for x in (raw.get("touch") or [])]
+        acceptance = _strlist(raw.get("acceptance"))
         max_files = raw.get("max_files")
         max_loc = raw.get("max_loc")
         pit_stop_after = raw.get("pit_stop_after")
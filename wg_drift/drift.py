@@ -5,10 +5,10 @@ from typing import Any
 
 from wg_drift.contracts import TaskContract, extract_contract
 from wg_drift.git_tools import WorkingChanges
-from wg_drift.globmatch import match_any
+from wg_drift.globmatch import match_any_batch
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Finding:
     kind: str
     severity: str
@@ -16,39 +16,46 @@ class Finding:
     details: dict[str, Any] | None = None
 
 
+_HARDENING_NEEDLES = (
+    "fallback",
+    "retry",
+    "backoff",
+    "timeout",
+    "graceful",
+    "guardrail",
+    "defensive",
+    "best effort",
+    "silently",
+    "swallow",
+)
+
+
+# Every substring the per-line scan can report on; used to rule out clean diffs early.
+_HARDENING_PRECHECK = tuple(
+    n.encode("utf-8") for n in ("except exception", "except:", "catch (", *_HARDENING_NEEDLES)
+)
+
+
 def _hardening_signals(added_lines: list[str]) -> list[str]:
+    # Most diffs carry no signal at all: one lowercased bytes blob probed per needle
+    # settles that in C. Otherwise, per-line `in` probes on short lowercased lines
+    # measure faster in CPython than one regex alternation or per-needle str.find over
+    # the joined diff text.
+    blob = "\n".join(added_lines).lower().encode("utf-8")
+    if not any(n in blob for n in _HARDENING_PRECHECK):
+        return []
     signals: list[str] = []
-    needles = [
-        "fallback",
-        "retry",
-        "backoff",
-        "timeout",
-        "graceful",
-        "guardrail",
-        "defensive",
-        "best effort",
-        "silently",
-        "swallow",
-    ]
-
     for line in added_lines:
         lower = line.lower()
         if "except exception" in lower or lower.strip() == "except:":
             signals.append("broad exception handling")
         if "catch (" in lower:
             signals.append("catch added")
-        for n in needles:
+        for n in _HARDENING_NEEDLES:
             if n in lower:
                 signals.append(n)
     # de-dup stable order
-    seen: set[str] = set()
-    out: list[str] = []
-    for s in signals:
-        if s in seen:
-            continue
-        seen.add(s)
-        out.append(s)
-    return out
+    return list(dict.fromkeys(signals))
 
 
 def compute_drift(
@@ -94,7 +101,8 @@ def compute_drift(
         if contract.mode == "core":
             # Scope drift
             if changes and contract.touch:
-                out_of_scope = [p for p in drift_files if not match_any(p, contract.touch)]
+                in_scope = match_any_batch(drift_files, contract.touch)
+                out_of_scope = [p for p, ok in zip(drift_files, in_scope) if not ok]
                 if out_of_scope:
                     telemetry["out_of_scope_files"] = len(out_of_scope)
                     findings.append(
@@ -108,7 +116,8 @@ def compute_drift(
 
             # Dependency drift
             if changes:
-                dep_files = [p for p in drift_files if p in _DEPENDENCY_FILES]
+                # Match on basename so nested manifests (monorepo packages) count too.
+                dep_files = [p for p in drift_files if p.rpartition("/")[2] in _DEPENDENCY_FILES]
                 if dep_files:
                     telemetry["dependency_files"] = dep_files
                     findings.append(
@@ -214,9 +223,11 @@ def compute_drift(
                 }
             )
 
-    # De-dupe by action while preserving order.
-    seen_actions: set[str] = set()
-    recommendations = [r for r in recommendations if not (r["action"] in seen_actions or seen_actions.add(r["action"]))]
+    # De-dupe by action while preserving order (first occurrence wins).
+    by_action: dict[str, dict[str, Any]] = {}
+    for r in recommendations:
+        by_action.setdefault(r["action"], r)
+    recommendations = list(by_action.values())
 
     return {
         "task_id": task_id,
@@ -225,7 +236,12 @@ def compute_drift(
         "score": score,
         "contract": contract_raw or (asdict(contract) if contract else None),
         "telemetry": telemetry,
-        "findings": [asdict(f) for f in findings],
+        # Finding is flat: a literal skips asdict's recursive deepcopy of details.
+        "findings": [
+            {"kind": f.kind, "severity": f.severity, "summary": f.summary, "details": f.details} for f in findings
+        ],
+        # Sorted distinct finding kinds: the drift signature consumers compare across runs.
+        "kinds": sorted({f.kind for f in findings}),
         "recommendations": recommendations,
     }
 
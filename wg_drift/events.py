@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import json
+import os
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, Iterable
 
 
 def _now_iso() -> str:
@@ -15,13 +16,60 @@ def events_path(wg_dir: Path) -> Path:
 
 
 def append_event(wg_dir: Path, event: dict[str, Any]) -> None:
+    append_events(wg_dir, [event])
+
+
+def append_events(wg_dir: Path, events: Iterable[dict[str, Any]]) -> None:
+    """
+    Appends a batch of events with one open and one write; events without a
+    timestamp share one taken at the start of the batch.
+    """
+
+    # One timestamp for the whole batch: the events describe the same moment (a tick).
+    now = _now_iso()
+    lines: list[str] = []
+    for event in events:
+        event = dict(event)
+        event.setdefault("schema", 1)
+        event.setdefault("timestamp", now)
+        lines.append(json.dumps(event, separators=(",", ":")) + "\n")
+    if not lines:
+        return
+
     p = events_path(wg_dir)
     p.parent.mkdir(parents=True, exist_ok=True)
-    event = dict(event)
-    event.setdefault("schema", 1)
-    event.setdefault("timestamp", _now_iso())
-    with p.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(event, separators=(",", ":")) + "\n")
+    # json.dumps escapes non-ASCII, so the payload is ASCII: encode once and hand it to
+    # the kernel in a single O_APPEND write. Each write lands at the current end of file,
+    # so concurrent writers (several agents logging at once) never interleave within a
+    # batch; POSIX only promises this for writes up to PIPE_BUF, which a few events fit in.
+    payload = "".join(lines).encode("utf-8")
+    # 0o666 like open(p, "a"): the umask decides the permissions of a new file.
+    fd = os.open(p, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o666)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def _read_lines(f: IO[bytes], offset: int) -> tuple[list[dict[str, Any]], int]:
+    # One read of the tail, split in C. Only newline-terminated lines are consumed, so
+    # an append still in flight is picked up whole on the next call.
+    f.seek(offset)
+    data = f.read()
+    end = data.rfind(b"\n") + 1
+    events: list[dict[str, Any]] = []
+    for line in data[:end].decode("utf-8", errors="replace").split("\n"):
+        if not line.strip():
+            continue
+        try:
+            obj = json.loads(line)
+            if isinstance(obj, dict):
+                events.append(obj)
+        except Exception:
+            continue
+    return (events, offset + end)
 
 
 def read_events_since(path: Path, offset: int) -> tuple[list[dict[str, Any]], int]:
@@ -37,23 +85,46 @@ def read_events_since(path: Path, offset: int) -> tuple[list[dict[str, Any]], in
     if offset > size:
         offset = 0
 
-    events: list[dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as f:
-        f.seek(offset)
-        while True:
-            line = f.readline()
-            if not line:
-                break
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                obj = json.loads(line)
-                if isinstance(obj, dict):
-                    events.append(obj)
-            except Exception:
-                continue
-        new_offset = f.tell()
-
-    return (events, new_offset)
+    with path.open("rb") as f:
+        return _read_lines(f, offset)
+
+
+class EventTail:
+    """
+    read_events_since over a handle kept open between calls, for polling loops.
+
+    Reopens when the file is replaced (inode change); a truncated file restarts at 0.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._f: IO[bytes] | None = None
+        self._ino: int | None = None
+
+    def read_since(self, offset: int) -> tuple[list[dict[str, Any]], int]:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            self.close()
+            return ([], offset)
+
+        if self._f is None or st.st_ino != self._ino:
+            self.close()
+            self._f = self.path.open("rb")
+            self._ino = os.fstat(self._f.fileno()).st_ino
+
+        if offset > st.st_size:
+            offset = 0
+        return _read_lines(self._f, offset)
+
+    def __enter__(self) -> "EventTail":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
 
+    def close(self) -> None:
+        if self._f is not None:
+            self._f.close()
+            self._f = None
+            self._ino = None
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import os
+import secrets
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, TextIO
+
+
+@contextmanager
+def atomic_writer(path: Path) -> Iterator[TextIO]:
+    """
+    Text file that replaces `path` in one rename when the block exits cleanly.
+
+    Each writer gets its own exclusively created temp file next to `path`, so
+    concurrent writers never interleave into a shared temp (last rename wins). On
+    error the temp file is removed and `path` is left untouched.
+    """
+
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{secrets.token_hex(4)}.tmp")
+    # 0o666 like a plain open(): the umask decides the final permissions.
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            yield f
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
@@ -17,51 +17,87 @@ def get_git_root(project_dir: Path) -> str | None:
         return None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WorkingChanges:
     changed_files: list[str]
     loc_changed: int
     added_lines: list[str]
 
 
-def _git_lines(args: list[str], *, cwd: str) -> list[str]:
+def _git_start(args: list[str], *, cwd: str) -> subprocess.Popen[str] | None:
     try:
-        out = subprocess.check_output(["git", "-C", cwd, *args], text=True, stderr=subprocess.DEVNULL)
+        return subprocess.Popen(["git", "-C", cwd, *args], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
     except Exception:
-        return []
+        return None
+
+
+def _git_output(proc: subprocess.Popen[str] | None) -> str:
+    # Same contract as check_output in a try: any failure reads as empty output.
+    if proc is None:
+        return ""
+    try:
+        out, _ = proc.communicate()
+    except Exception:
+        proc.kill()
+        proc.wait()
+        return ""
+    return out if proc.returncode == 0 else ""
+
+
+def _nonblank_lines(out: str) -> list[str]:
     return [l for l in out.splitlines() if l.strip()]
 
 
-def get_working_changes(git_root: str) -> WorkingChanges:
-    # Collect changed file paths (staged, unstaged, and untracked).
-    unstaged = set(_git_lines(["diff", "--name-only"], cwd=git_root))
-    staged = set(_git_lines(["diff", "--name-only", "--cached"], cwd=git_root))
-    untracked = set(_git_lines(["ls-files", "--others", "--exclude-standard"], cwd=git_root))
+def _git_status_v2(out: str) -> tuple[list[tuple[str, str]], bool]:
+    """
+    Parses `git status --porcelain=v2 -z --branch` output.
 
-    changed = sorted(unstaged | staged | untracked)
+    Returns ([(path, xy), ...], has_head); untracked entries carry xy '??'.
+    """
 
-    # LOC churn (added + deleted) from staged + unstaged
-    numstats = _git_lines(["diff", "--numstat"], cwd=git_root) + _git_lines(["diff", "--numstat", "--cached"], cwd=git_root)
-    loc_changed = 0
-    for line in numstats:
-        parts = line.split("\t")
-        if len(parts) < 3:
+    entries: list[tuple[str, str]] = []
+    has_head = True
+    records = out.split("\0")
+    i = 0
+    while i < len(records):
+        rec = records[i]
+        i += 1
+        if not rec:
             continue
-        add_s, del_s = parts[0], parts[1]
-        try:
-            add_n = int(add_s) if add_s != "-" else 0
-            del_n = int(del_s) if del_s != "-" else 0
-            loc_changed += add_n + del_n
-        except ValueError:
-            continue
-
-    # Added lines (best-effort). Filter out .workgraph noise to avoid false positives.
-    added_lines: list[str] = []
+        kind = rec[0]
+        if kind == "#":
+            if rec == "# branch.oid (initial)":
+                has_head = False
+        elif kind == "1":
+            # 1 XY sub mH mI mW hH hI path
+            entries.append((rec.split(" ", 8)[8], rec[2:4]))
+        elif kind == "2":
+            # 2 XY sub mH mI mW hH hI Xscore path, then the original path as its own record.
+            entries.append((rec.split(" ", 9)[9], rec[2:4]))
+            i += 1
+        elif kind == "u":
+            # u XY sub m1 m2 m3 mW h1 h2 h3 path
+            entries.append((rec.split(" ", 10)[10], rec[2:4]))
+        elif kind == "?":
+            entries.append((rec[2:], "??"))
+    return (entries, has_head)
+
+
+def _collect_added(proc: subprocess.Popen[str] | None) -> list[str]:
+    """
+    Streams `git diff --unified=0` output line by line and returns the added lines,
+    skipping .workgraph/.git noise. Like _git_output, a failed run yields nothing.
+    """
+
+    if proc is None or proc.stdout is None:
+        return []
 
-    def collect_added(diff_text: str) -> None:
-        cur_file: str | None = None
-        include_file = True
-        for line in diff_text.splitlines():
+    added: list[str] = []
+    cur_file: str | None = None
+    include_file = True
+    try:
+        for line in proc.stdout:
+            line = line.rstrip("\n")
             if line.startswith("diff --git "):
                 # Example: diff --git a/src/app.py b/src/app.py
                 parts = line.split()
@@ -80,21 +116,58 @@ def get_working_changes(git_root: str) -> WorkingChanges:
                 continue
             if line.startswith("+++"):
                 continue
-            added_lines.append(line[1:])
-
-    try:
-        collect_added(
-            subprocess.check_output(["git", "-C", git_root, "diff", "--unified=0"], text=True, stderr=subprocess.DEVNULL)
-        )
+            added.append(line[1:])
     except Exception:
-        pass
-    try:
-        collect_added(
-            subprocess.check_output(
-                ["git", "-C", git_root, "diff", "--unified=0", "--cached"], text=True, stderr=subprocess.DEVNULL
-            )
+        proc.kill()
+        proc.wait()
+        return []
+    finally:
+        proc.stdout.close()
+    return added if proc.wait() == 0 else []
+
+
+def get_working_changes(git_root: str) -> WorkingChanges:
+    # One status call lists staged, unstaged, and untracked paths; diffs against HEAD
+    # cover staged + unstaged changes at once. All three run concurrently.
+    status_proc, numstat_proc, diff_proc = (
+        _git_start(args, cwd=git_root)
+        for args in (
+            ["status", "--porcelain=v2", "-z", "--branch", "--untracked-files=all"],
+            ["diff", "--numstat", "HEAD"],
+            ["diff", "--unified=0", "HEAD"],
         )
-    except Exception:
-        pass
+    )
+    entries, has_head = _git_status_v2(_git_output(status_proc))
+    # Git's order (tracked entries by path, then untracked), deduplicated; no resort.
+    changed = list(dict.fromkeys(path for path, _ in entries))
+
+    numstat_texts = [_git_output(numstat_proc)]
+    diff_procs = [diff_proc]
+    if not has_head:
+        # No commit to diff against yet: fall back to worktree-vs-index plus index-vs-empty.
+        _collect_added(diff_proc)  # reap the failed HEAD diff
+        numstat_procs = [_git_start(["diff", "--numstat", *extra], cwd=git_root) for extra in ([], ["--cached"])]
+        diff_procs = [_git_start(["diff", "--unified=0", *extra], cwd=git_root) for extra in ([], ["--cached"])]
+        numstat_texts = [_git_output(p) for p in numstat_procs]
+
+    # LOC churn (added + deleted) from staged + unstaged
+    loc_changed = 0
+    for text in numstat_texts:
+        for line in _nonblank_lines(text):
+            parts = line.split("\t", 2)
+            if len(parts) < 3:
+                continue
+            add_s, del_s = parts[0], parts[1]
+            try:
+                add_n = int(add_s) if add_s != "-" else 0
+                del_n = int(del_s) if del_s != "-" else 0
+                loc_changed += add_n + del_n
+            except ValueError:
+                continue
+
+    # Added lines (best-effort). Filter out .workgraph noise to avoid false positives.
+    added_lines: list[str] = []
+    for proc in diff_procs:
+        added_lines.extend(_collect_added(proc))
 
     return WorkingChanges(changed_files=changed, loc_changed=loc_changed, added_lines=added_lines)
@@ -1,6 +1,232 @@
 from __future__ import annotations
 
 import fnmatch
+import functools
+import re
+from typing import Any, Callable
+
+
+def _normalize(path: str) -> str:
+    # Git reports canonical paths; only rebuild when there is something to strip.
+    if "//" not in path and not path.startswith("/") and not path.endswith("/"):
+        return path
+    return "/".join(p for p in path.split("/") if p)
+
+
+def _translate_segment(seg: str) -> str:
+    """
+    Translate a single path-segment glob ('*', '?', '[...]') to a regex fragment.
+
+    Wildcards never match '/', mirroring fnmatch applied to one segment at a time.
+    """
+
+    if not seg.strip("*"):
+        # A segment is never empty, so a bare '*' must consume at least one char.
+        return "[^/]+"
+
+    out: list[str] = []
+    i, n = 0, len(seg)
+    while i < n:
+        c = seg[i]
+        i += 1
+        if c == "*":
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            j = i
+            if j < n and seg[j] == "!":
+                j += 1
+            if j < n and seg[j] == "]":
+                j += 1
+            while j < n and seg[j] != "]":
+                j += 1
+            if j >= n:
+                out.append("\\[")
+                continue
+            # Reuse fnmatch's class handling (ranges, '!', escaping), minus its wrapper.
+            cls = fnmatch.translate(seg[i - 1 : j + 1])
+            out.append("(?!/)" + cls[len("(?s:") : cls.rindex(")")])
+            i = j + 1
+        else:
+            out.append(re.escape(c))
+    return "".join(out)
+
+
+def _split_pattern(pattern: str) -> list[str]:
+    # Drop empty segments and collapse runs of '**' (they are equivalent to one).
+    segs: list[str] = []
+    for s in pattern.split("/"):
+        if not s or (s == "**" and segs and segs[-1] == "**"):
+            continue
+        segs.append(s)
+    return segs
+
+
+def _translate(pattern: str) -> str:
+    """
+    Translate a repo-root-relative glob to a regex matching a normalized path.
+    """
+
+    segs = _split_pattern(pattern)
+    n = len(segs)
+    out: list[str] = []
+    for i, seg in enumerate(segs):
+        if seg == "**":
+            if n == 1:
+                out.append(".*")
+            elif i == 0:
+                out.append("(?:.*/)?")
+            elif i == n - 1:
+                out.append("(?:/.*)?")
+            else:
+                out.append("/(?:.*/)?")
+            continue
+        if i > 0 and segs[i - 1] != "**":
+            out.append("/")
+        out.append(_translate_segment(seg))
+    return "".join(out)
+
+
+@functools.cache
+def _compile_segment(seg: str) -> Callable[[str], Any]:
+    # Shared across patterns: contracts reuse the same few segments ('*.py', 'src', ...).
+    if _is_literal(seg):
+        return seg.__eq__
+    return re.compile(_translate_segment(seg), re.DOTALL).fullmatch
+
+
+def _compile_nfa(pattern: str) -> Callable[[str], bool]:
+    """
+    Segment-level NFA simulation: states are pattern positions, input symbols are
+    path segments. Runs in O(segments * pattern) with no backtracking, which the
+    regex form cannot guarantee once a pattern has several '**' segments.
+    """
+
+    segs = _split_pattern(pattern)
+    n = len(segs)
+    seg_match = [None if s == "**" else _compile_segment(s) for s in segs]
+
+    # Epsilon closure: a '**' may match zero segments.
+    closure: list[frozenset[int]] = []
+    for j in range(n + 1):
+        k = j
+        reach = {k}
+        while k < n and seg_match[k] is None:
+            k += 1
+            reach.add(k)
+        closure.append(frozenset(reach))
+
+    def match(path: str) -> bool:
+        states = closure[0]
+        for part in path.split("/") if path else ():
+            nxt: set[int] = set()
+            for j in states:
+                if j == n:
+                    continue
+                m = seg_match[j]
+                if m is None:
+                    nxt |= closure[j]
+                elif m(part):
+                    nxt |= closure[j + 1]
+            if not nxt:
+                return False
+            states = nxt
+        return n in states
+
+    return match
+
+
+def _is_literal(seg: str) -> bool:
+    return not any(c in seg for c in "*?[")
+
+
+def _specialize(pattern: str) -> Callable[[str], bool] | None:
+    """
+    Plain string checks for the common shapes ('src/**', '**/*.md', '**/name', literal),
+    bypassing the regex machinery. Returns None for anything else.
+    """
+
+    segs = _split_pattern(pattern)
+    if segs == ["**"]:
+        return lambda path: True
+    if all(_is_literal(s) for s in segs):
+        literal = "/".join(segs)
+        return lambda path: path == literal
+    if len(segs) >= 2 and segs[-1] == "**" and all(_is_literal(s) for s in segs[:-1]):
+        prefix = "/".join(segs[:-1])
+        prefix_sep = prefix + "/"
+        return lambda path: path == prefix or path.startswith(prefix_sep)
+    if len(segs) == 2 and segs[0] == "**":
+        last = segs[1]
+        if _is_literal(last):
+            suffix = "/" + last
+            return lambda path: path == last or path.endswith(suffix)
+        tail = last[1:]
+        if last.startswith("*") and tail and _is_literal(tail):
+            # '*' may match empty and the tail has no '/', so this is a plain suffix test.
+            return lambda path: path.endswith(tail)
+    return None
+
+
+def _needs_nfa(pattern: str) -> bool:
+    return _split_pattern(pattern).count("**") > 1
+
+
+# Regex-safe patterns start on the NFA (cheap to build from cached segments) and are
+# promoted to a compiled regex once they have been matched this many times.
+_PROMOTE_AFTER = 16
+
+# Unbounded: glob vocabularies are small (contract touch lists).
+_MATCHERS: dict[str, Callable[[str], Any]] = {}
+
+
+def _lazy_regex(pattern: str) -> Callable[[str], bool]:
+    nfa = _compile_nfa(pattern)
+    hits = 0
+
+    def match(path: str) -> bool:
+        nonlocal hits
+        hits += 1
+        if hits == _PROMOTE_AFTER:
+            _MATCHERS[pattern] = re.compile(_translate(pattern), re.DOTALL).fullmatch
+        return nfa(path)
+
+    return match
+
+
+def _compile_pattern(pattern: str) -> Callable[[str], Any]:
+    m = _MATCHERS.get(pattern)
+    if m is None:
+        m = _specialize(pattern)
+        if m is None:
+            m = _compile_nfa(pattern) if _needs_nfa(pattern) else _lazy_regex(pattern)
+        _MATCHERS[pattern] = m
+    return m
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_globs(patterns: tuple[str, ...]) -> tuple[Callable[[str], Any], ...]:
+    """
+    Bound matchers for a pattern list, cheapest first: specialized string checks, then
+    one alternation for the regex-safe rest (a single C-level scan), then NFAs for the
+    backtracking-prone patterns.
+    """
+
+    fast: list[Callable[[str], Any]] = []
+    simple: list[str] = []
+    nfas: list[Callable[[str], Any]] = []
+    for p in patterns:
+        m = _specialize(p)
+        if m is not None:
+            fast.append(m)
+        elif _needs_nfa(p):
+            nfas.append(_compile_pattern(p))
+        else:
+            simple.append(p)
+    if simple:
+        fast.append(re.compile("|".join(f"(?:{_translate(p)})" for p in simple), re.DOTALL).fullmatch)
+    return tuple(fast + nfas)
 
 
 def match_path(path: str, pattern: str) -> bool:
@@ -13,31 +239,59 @@ def match_path(path: str, pattern: str) -> bool:
     - '**' matches zero or more path segments.
     """
 
-    path_parts = [p for p in path.strip("/").split("/") if p]
-    pat_parts = [p for p in pattern.strip("/").split("/") if p]
-
-    def rec(i: int, j: int) -> bool:
-        if j >= len(pat_parts):
-            return i >= len(path_parts)
+    return bool(_compile_pattern(pattern)(_normalize(path)))
 
-        pat = pat_parts[j]
-        if pat == "**":
-            # Match zero segments
-            if rec(i, j + 1):
-                return True
-            # Match one segment and keep '**'
-            return i < len(path_parts) and rec(i + 1, j)
 
-        if i >= len(path_parts):
-            return False
+# Per pattern list, matchers reordered by hits (see match_any). Tuples are replaced,
+# never mutated, so concurrent readers always iterate a complete list.
+_HIT_ORDER: dict[tuple[str, ...], tuple[Callable[[str], Any], ...]] = {}
 
-        if not fnmatch.fnmatchcase(path_parts[i], pat):
-            return False
-        return rec(i + 1, j + 1)
 
-    return rec(0, 0)
+def _ordered_matchers(key: tuple[str, ...]) -> tuple[Callable[[str], Any], ...]:
+    matchers = _HIT_ORDER.get(key)
+    if matchers is None:
+        if len(_HIT_ORDER) >= 1024:
+            _HIT_ORDER.clear()
+        matchers = _HIT_ORDER[key] = _compile_globs(key)
+    return matchers
 
 
 def match_any(path: str, patterns: list[str]) -> bool:
-    return any(match_path(path, p) for p in patterns)
+    if not patterns:
+        return False
+    key = tuple(patterns)
+    matchers = _ordered_matchers(key)
+    path = _normalize(path)
+    for i, m in enumerate(matchers):
+        if m(path):
+            if i:
+                # Transpose with the previous slot: frequently hit globs drift to the front.
+                _HIT_ORDER[key] = matchers[: i - 1] + (m, matchers[i - 1]) + matchers[i + 1 :]
+            return True
+    return False
+
+
+def match_any_batch(paths: list[str], patterns: list[str]) -> list[bool]:
+    """
+    match_any for many paths against one pattern list (e.g. a changed-file set vs a
+    contract's touch globs). Matchers are resolved once for the whole batch.
+    """
 
+    if not patterns:
+        return [False] * len(paths)
+    key = tuple(patterns)
+    # Private copy: reorder in place while scanning, publish the final order once.
+    matchers = list(_ordered_matchers(key))
+    out: list[bool] = []
+    for path in paths:
+        path = _normalize(path)
+        for i, m in enumerate(matchers):
+            if m(path):
+                if i:
+                    matchers[i - 1], matchers[i] = m, matchers[i - 1]
+                out.append(True)
+                break
+        else:
+            out.append(False)
+    _HIT_ORDER[key] = tuple(matchers)
+    return out
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import re
 import stat
 from dataclasses import dataclass
@@ -9,7 +10,7 @@ COREDRIFT_MARKER = "## Coredrift Protocol"
 UXDRIFT_MARKER = "## uxdrift Protocol"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstallResult:
     wrote_wrapper: bool
     updated_gitignore: bool
@@ -23,21 +24,68 @@ def _ensure_line_in_file(path: Path, line: str) -> bool:
     Ensures `line` exists as a standalone line in `path`. Returns True if file changed.
     """
 
-    existing = ""
-    if path.exists():
-        existing = path.read_text(encoding="utf-8")
-    lines = existing.splitlines()
-    if any(l.strip() == line for l in lines):
-        return False
-    new = existing.rstrip("\n")
-    if new:
-        new += "\n"
-    new += line + "\n"
+    needle = line.encode("utf-8")
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        data = b""
+    if data:
+        # Common case on re-install: the exact line is already there, no decode needed.
+        if (
+            data == needle
+            or data.startswith(needle + b"\n")
+            or data.endswith(b"\n" + needle)
+            or b"\n" + needle + b"\n" in data
+        ):
+            return False
+        if any(l.strip() == line for l in data.decode("utf-8").splitlines()):
+            return False
+
+    stripped = data.rstrip(b"\n")
+    if stripped and len(data) - len(stripped) > 1:
+        # Collapse trailing blank lines before the new entry (needs a rewrite).
+        path.write_bytes(stripped + b"\n" + needle + b"\n")
+        return True
+
+    # Otherwise the new line goes at the end: append it instead of rewriting the file.
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(new, encoding="utf-8")
+    payload = (b"\n" if stripped and stripped == data else b"") + needle + b"\n"
+    flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+    if not stripped:
+        # Empty, missing, or newline-only: the line becomes the whole file.
+        flags |= os.O_TRUNC
+    fd = os.open(path, flags, 0o666)
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
     return True
 
 
+_EXEC_BITS = stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH
+
+
+def _write_executable(path: Path, content: str) -> bool:
+    """
+    Writes `content` to `path` (if different) and makes it executable. Returns True if
+    the content changed.
+    """
+
+    data = content.encode("utf-8")
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        st = None
+    # A size mismatch settles it without reading the file back.
+    changed = st is None or st.st_size != len(data) or path.read_bytes() != data
+    if changed:
+        path.write_bytes(data)
+        st = path.stat()
+    if st.st_mode & _EXEC_BITS != _EXEC_BITS:
+        path.chmod(st.st_mode | _EXEC_BITS)
+    return changed
+
+
 def ensure_coredrift_gitignore(wg_dir: Path) -> bool:
     return _ensure_line_in_file(wg_dir / ".gitignore", ".coredrift/")
 
@@ -59,12 +107,7 @@ def write_tool_wrapper(wg_dir: Path, *, tool_name: str, tool_bin: Path) -> bool:
         f'exec "{tool_bin}" "$@"\n'
     )
 
-    existing = wrapper.read_text(encoding="utf-8") if wrapper.exists() else None
-    changed = existing != content
-    if changed:
-        wrapper.write_text(content, encoding="utf-8")
-    wrapper.chmod(wrapper.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
-    return changed
+    return _write_executable(wrapper, content)
 
 
 def write_coredrift_wrapper(wg_dir: Path, *, coredrift_bin: Path) -> bool:
@@ -192,12 +235,7 @@ def write_drifts_wrapper(wg_dir: Path) -> bool:
         "exit 0\n"
     )
 
-    existing = wrapper.read_text(encoding="utf-8") if wrapper.exists() else None
-    changed = existing != content
-    if changed:
-        wrapper.write_text(content, encoding="utf-8")
-    wrapper.chmod(wrapper.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
-    return changed
+    return _write_executable(wrapper, content)
 
 
 def _default_claude_executor_text(*, project_dir: Path, include_uxdrift: bool) -> str:
@@ -255,77 +293,77 @@ Context from dependencies:
 # """
 _TEMPLATE_START_RE = re.compile(r'(?P<prefix>\btemplate\s*=\s*"""\r?\n)', re.MULTILINE)
 
-
-def _inject_coredrift_into_template(body: str) -> str | None:
+_LEGACY_CHECK_CMD = "  ./.workgraph/coredrift check --task {{task_id}} --write-log --create-followups"
+_DRIFTS_CHECK_CMD = "  ./.workgraph/drifts check --task {{task_id}} --write-log --create-followups"
+
+# Protocol sections appended to executor templates; built once at import.
+_COREDRIFT_INSERT = (
+    "\n"
+    f"{COREDRIFT_MARKER}\n"
+    "- Treat the `wg-contract` block (in the task description) as binding.\n"
+    "- At start and just before completion, run:\n"
+    "  ./.workgraph/drifts check --task {{task_id}} --write-log --create-followups\n"
+    "- If you need to change scope, update touch globs:\n"
+    "  ./.workgraph/coredrift contract set-touch --task {{task_id}} <globs...>\n"
+    "- If Coredrift flags `hardening_in_core`, do NOT add guardrails here; create/complete the `harden:` follow-up task.\n"
+)
+
+_UXDRIFT_INSERT = (
+    "\n"
+    f"{UXDRIFT_MARKER}\n"
+    "- If this task includes a `uxdrift` block (in the description), run:\n"
+    "  ./.workgraph/uxdrift wg check --task {{task_id}} --write-log --create-followups\n"
+    "- Or run the unified check (runs uxdrift when a spec is present):\n"
+    "  ./.workgraph/drifts check --task {{task_id}} --write-log --create-followups\n"
+    "- If it fails due to missing URL, set `url = \"...\"` in the `uxdrift` block or pass --url.\n"
+    "- Artifacts live under `.workgraph/.uxdrift/`.\n"
+)
+
+
+def _template_end(body: str) -> int | None:
     """
-    Returns modified file text, or None if no changes needed/possible.
+    Offset of the closing triple quotes of the first prompt template, or None.
     """
 
-    if COREDRIFT_MARKER in body:
-        # Upgrade existing protocol blocks in-place if they reference coredrift directly.
-        old = "  ./.workgraph/coredrift check --task {{task_id}} --write-log --create-followups"
-        new = "  ./.workgraph/drifts check --task {{task_id}} --write-log --create-followups"
-        upgraded = body.replace(old, new)
-        if upgraded != body:
-            return upgraded
-        return None
-
+    # A regex search for the opening plus str.find for the close: one lazy `.*?"""`
+    # pattern measured 10-15x slower on large templates.
     m = _TEMPLATE_START_RE.search(body)
     if not m:
         return None
-
-    start = m.end("prefix")
-    end = body.find('\"\"\"', start)
-    if end == -1:
-        return None
-
-    insert = (
-        "\n"
-        f"{COREDRIFT_MARKER}\n"
-        "- Treat the `wg-contract` block (in the task description) as binding.\n"
-        "- At start and just before completion, run:\n"
-        "  ./.workgraph/drifts check --task {{task_id}} --write-log --create-followups\n"
-        "- If you need to change scope, update touch globs:\n"
-        "  ./.workgraph/coredrift contract set-touch --task {{task_id}} <globs...>\n"
-        "- If Coredrift flags `hardening_in_core`, do NOT add guardrails here; create/complete the `harden:` follow-up task.\n"
-    )
-
-    # Insert right before the closing triple quotes.
-    new_body = body[:end].rstrip("\n") + "\n" + insert + "\n" + body[end:]
-    return new_body
+    end = body.find('"""', m.end("prefix"))
+    return end if end != -1 else None
 
 
-def _inject_uxdrift_into_template(body: str) -> str | None:
+def _inject_markers(body: str, *, coredrift: bool = True, uxdrift: bool = False) -> str | None:
     """
     Returns modified file text, or None if no changes needed/possible.
-    """
-
-    if UXDRIFT_MARKER in body:
-        return None
-
-    m = _TEMPLATE_START_RE.search(body)
-    if not m:
-        return None
 
-    start = m.end("prefix")
-    end = body.find('\"\"\"', start)
-    if end == -1:
-        return None
-
-    insert = (
-        "\n"
-        f"{UXDRIFT_MARKER}\n"
-        "- If this task includes a `uxdrift` block (in the description), run:\n"
-        "  ./.workgraph/uxdrift wg check --task {{task_id}} --write-log --create-followups\n"
-        "- Or run the unified check (runs uxdrift when a spec is present):\n"
-        "  ./.workgraph/drifts check --task {{task_id}} --write-log --create-followups\n"
-        "- If it fails due to missing URL, set `url = \"...\"` in the `uxdrift` block or pass --url.\n"
-        "- Artifacts live under `.workgraph/.uxdrift/`.\n"
-    )
+    Adds whichever requested protocol sections are missing in one pass: the template is
+    located once and all sections go in right before its closing triple quotes.
+    """
 
-    # Insert right before the closing triple quotes.
-    new_body = body[:end].rstrip("\n") + "\n" + insert + "\n" + body[end:]
-    return new_body
+    cur = body
+    inserts: list[str] = []
+    if coredrift:
+        if COREDRIFT_MARKER in cur:
+            # Upgrade existing protocol blocks in-place if they reference coredrift directly.
+            cur = cur.replace(_LEGACY_CHECK_CMD, _DRIFTS_CHECK_CMD)
+        else:
+            inserts.append(_COREDRIFT_INSERT)
+    if uxdrift and UXDRIFT_MARKER not in cur:
+        inserts.append(_UXDRIFT_INSERT)
+
+    if inserts:
+        end = _template_end(cur)
+        if end is not None:
+            # Same layout as inserting the sections one after another.
+            parts = [cur[:end].rstrip("\n")]
+            for insert in inserts[:-1]:
+                parts += ["\n", insert.rstrip("\n")]
+            parts += ["\n", inserts[-1], "\n", cur[end:]]
+            cur = "".join(parts)
+
+    return cur if cur != body else None
 
 
 def ensure_executor_guidance(wg_dir: Path, *, include_uxdrift: bool = False) -> tuple[bool, list[str]]:
@@ -339,34 +377,35 @@ def ensure_executor_guidance(wg_dir: Path, *, include_uxdrift: bool = False) ->
 
     created = False
     claude_path = executors_dir / "claude.toml"
-    if not claude_path.exists():
-        claude_path.write_text(
-            _default_claude_executor_text(project_dir=wg_dir.parent, include_uxdrift=include_uxdrift),
-            encoding="utf-8",
-        )
+    try:
+        # Exclusive create: no separate exists() probe, and never clobbers a concurrent write.
+        with claude_path.open("x", encoding="utf-8") as f:
+            f.write(_default_claude_executor_text(project_dir=wg_dir.parent, include_uxdrift=include_uxdrift))
         created = True
+    except FileExistsError:
+        pass
+
+    # Already-patched executors are recognized on raw bytes and never decoded.
+    done_markers = [COREDRIFT_MARKER.encode("utf-8")]
+    if include_uxdrift:
+        done_markers.append(UXDRIFT_MARKER.encode("utf-8"))
+    legacy = _LEGACY_CHECK_CMD.encode("utf-8")
+
+    # One directory read; dirents carry the file type, so non-files cost no extra stat.
+    with os.scandir(executors_dir) as it:
+        names = sorted(e.name for e in it if e.name.endswith(".toml") and e.is_file())
 
     patched: list[str] = []
-    for p in sorted(executors_dir.glob("*.toml")):
-        text = p.read_text(encoding="utf-8")
-        cur = text
-        changed = False
-
-        new_text = _inject_coredrift_into_template(cur)
-        if new_text is not None:
-            cur = new_text
-            changed = True
-
-        if include_uxdrift:
-            new_text = _inject_uxdrift_into_template(cur)
-            if new_text is not None:
-                cur = new_text
-                changed = True
-
-        if not changed:
+    for name in names:
+        p = executors_dir / name
+        data = p.read_bytes()
+        if all(m in data for m in done_markers) and legacy not in data:
+            continue
+        new_text = _inject_markers(data.decode("utf-8"), uxdrift=include_uxdrift)
+        if new_text is None:
             continue
 
-        p.write_text(cur, encoding="utf-8")
+        p.write_text(new_text, encoding="utf-8")
         patched.append(str(p))
 
     return (created, patched)
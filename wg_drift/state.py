@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import json
+import os
+import time
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Iterator
 
+from wg_drift.fs_tools import atomic_writer
+
 
 def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -19,10 +23,38 @@ def lock_path(wg_dir: Path) -> Path:
     return wg_dir / ".coredrift" / "state.lock"
 
 
+# Last text read per state file: (stat signature, when it was read, text). The signature
+# alone can collide: a rename frees the old inode for the next temp file, and two writes
+# in one timestamp tick can leave the same mtime and size. So, as git does for its racy
+# index entries, a hit is only trusted when the file's mtime predates the read by more
+# than any timestamp granularity; a later write must then show a newer mtime.
+_STATE_TEXT: dict[Path, tuple[tuple[int, int, int, int, int], int, str]] = {}
+
+_RACY_NS = 2_000_000_000
+
+
+def _stat_sig(st: os.stat_result) -> tuple[int, int, int, int, int]:
+    return (st.st_dev, st.st_ino, st.st_mtime_ns, st.st_ctime_ns, st.st_size)
+
+
+def _read_state_text(p: Path) -> str:
+    st = p.stat()
+    sig = _stat_sig(st)
+    hit = _STATE_TEXT.get(p)
+    if hit is not None and hit[0] == sig and st.st_mtime_ns < hit[1] - _RACY_NS:
+        return hit[2]
+    # Stamp before reading: a replace between the stat and the read caches the newer
+    # text under the older signature, and that file's mtime is too recent to trust.
+    read_ns = time.time_ns()
+    text = p.read_text(encoding="utf-8")
+    _STATE_TEXT[p] = (sig, read_ns, text)
+    return text
+
+
 def load_state_unlocked(wg_dir: Path) -> dict[str, Any]:
     p = state_path(wg_dir)
     try:
-        data = json.loads(p.read_text(encoding="utf-8"))
+        data = json.loads(_read_state_text(p))
         if isinstance(data, dict):
             return data
     except Exception:
@@ -30,12 +62,26 @@ def load_state_unlocked(wg_dir: Path) -> dict[str, Any]:
     return {"schema": 1, "tasks": {}, "event_cursor": 0}
 
 
+# state.json stays indented for people and tools that read or diff it; one shared encoder
+# just spares json.dumps() building a new one on every locked_state() exit.
+_encode_state = json.JSONEncoder(indent=2).encode
+
+
 def save_state_unlocked(wg_dir: Path, state: dict[str, Any]) -> None:
     p = state_path(wg_dir)
+    text = _encode_state(state) + "\n"
+    try:
+        # Compare against what is on disk now (cached only when provably unchanged), so
+        # an unchanged state skips the rewrite but another writer's update never does.
+        if _read_state_text(p) == text:
+            return
+    except (OSError, ValueError):
+        pass
     p.parent.mkdir(parents=True, exist_ok=True)
-    tmp = p.with_suffix(".tmp")
-    tmp.write_text(json.dumps(state, indent=2, sort_keys=False) + "\n", encoding="utf-8")
-    tmp.replace(p)
+    with atomic_writer(p) as f:
+        f.write(text)
+    # A just-written file is too fresh to trust anyway; the next read re-validates it.
+    _STATE_TEXT.pop(p, None)
 
 @contextmanager
 def locked_state(wg_dir: Path) -> Iterator[dict[str, Any]]:
@@ -75,7 +121,7 @@ def save_state(wg_dir: Path, state: dict[str, Any]) -> None:
     save_state_unlocked(wg_dir, state)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TaskStateUpdate:
     task_id: str
     streak: int
@@ -4,8 +4,10 @@
 from __future__ import annotations
 
 import json
+import re
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Iterable, Iterator, TextIO
 
 from speedrift_lane_sdk.workgraph import (  # noqa: F401
     Workgraph,
@@ -14,74 +16,135 @@ from speedrift_lane_sdk.workgraph import (  # noqa: F401
 )
 
 from wg_drift.contracts import extract_contract, format_default_contract_block
+from wg_drift.fs_tools import atomic_writer
 
 
-@dataclass(frozen=True)
+# json.dumps builds a fresh JSONEncoder whenever non-default options are passed; reuse one.
+_dumps = json.JSONEncoder(separators=(",", ":")).encode
+
+# A line whose "kind" is "task" must spell that string out, whatever the key spacing;
+# lines without it (logs, edges, ...) pass through unparsed and byte-for-byte.
+_TASK_TOKEN = '"task"'
+
+
+@dataclass(frozen=True, slots=True)
 class ContractPatchResult:
     updated_tasks: list[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TaskRewriteResult:
     updated: bool
 
 
+def _graph_lines(f: TextIO) -> Iterator[str]:
+    # Streams non-blank lines without their newline; the file is never held whole.
+    for line in f:
+        if line.strip():
+            yield line.rstrip("\n")
+
+
+def _write_graph_lines(graph_path: Path, lines: Iterable[str]) -> None:
+    with atomic_writer(graph_path) as f:
+        for line in lines:
+            f.write(line)
+            f.write("\n")
+
+
+_DESC_KEY_RE = re.compile(r'"description"\s*:\s*')
+_decode_value = json.JSONDecoder().raw_decode
+
+
+def _splice_description(line: str, obj: dict[str, Any], new_description: str) -> str | None:
+    """
+    Replaces just the encoded description value in a task line, leaving every other
+    byte as written. Returns None (caller re-serializes) unless the line spells the key
+    exactly once and the value found there is the one parsed into `obj`.
+    """
+
+    old = obj.get("description")
+    if not isinstance(old, str):
+        return None
+    m = _DESC_KEY_RE.search(line)
+    if m is None or _DESC_KEY_RE.search(line, m.end()) is not None:
+        return None
+    try:
+        value, end = _decode_value(line, m.end())
+    except ValueError:
+        return None
+    if value != old:
+        return None
+    return line[: m.end()] + _dumps(new_description) + line[end:]
+
+
 def update_task_description(*, wg_dir: Path, task_id: str, new_description: str) -> TaskRewriteResult:
-    graph_path = wg_dir / "graph.jsonl"
-    lines_in = graph_path.read_text(encoding="utf-8").splitlines()
-    lines_out: list[str] = []
-    updated = False
+    return update_task_descriptions(wg_dir=wg_dir, updates={task_id: new_description})
 
-    for line in lines_in:
-        if not line.strip():
-            continue
-        obj = json.loads(line)
-        if obj.get("kind") != "task":
-            lines_out.append(line)
-            continue
-        tid = str(obj.get("id"))
-        if tid != task_id:
-            lines_out.append(line)
-            continue
-        obj["description"] = new_description
-        updated = True
-        lines_out.append(json.dumps(obj, separators=(",", ":")))
 
-    if not updated:
-        raise ValueError(f"Task not found in graph.jsonl: {task_id}")
+def update_task_descriptions(*, wg_dir: Path, updates: dict[str, str]) -> TaskRewriteResult:
+    """
+    Sets several task descriptions in one streamed pass over graph.jsonl (one read, one
+    rewrite) instead of one full rewrite per task.
+    """
 
-    tmp = graph_path.with_suffix(".jsonl.tmp")
-    tmp.write_text("\n".join(lines_out) + "\n", encoding="utf-8")
-    tmp.replace(graph_path)
+    if not updates:
+        return TaskRewriteResult(updated=False)
 
-    return TaskRewriteResult(updated=True)
+    graph_path = wg_dir / "graph.jsonl"
+    seen: set[str] = set()
+
+    def rewritten(f: TextIO) -> Iterator[str]:
+        for line in _graph_lines(f):
+            if _TASK_TOKEN not in line:
+                yield line
+                continue
+            obj = json.loads(line)
+            if obj.get("kind") != "task":
+                yield line
+                continue
+            tid = str(obj.get("id"))
+            if tid not in updates:
+                yield line
+                continue
+            seen.add(tid)
+            spliced = _splice_description(line, obj, updates[tid])
+            if spliced is not None:
+                yield spliced
+                continue
+            obj["description"] = updates[tid]
+            yield _dumps(obj)
+        missing = [tid for tid in updates if tid not in seen]
+        if missing:
+            raise ValueError(f"Task not found in graph.jsonl: {', '.join(missing)}")
+
+    # Input and output are both streamed; the temp file is dropped if a task is missing.
+    with graph_path.open("r", encoding="utf-8") as f:
+        _write_graph_lines(graph_path, rewritten(f))
+
+    return TaskRewriteResult(updated=bool(seen))
 
 
 def rewrite_graph_with_contracts(*, wg_dir: Path, statuses: set[str], apply: bool) -> ContractPatchResult:
-    wg = load_workgraph(wg_dir)
     updated: list[str] = []
 
     graph_path = wg_dir / "graph.jsonl"
-    lines_in = graph_path.read_text(encoding="utf-8").splitlines()
-    lines_out: list[str] = []
+    with graph_path.open("r", encoding="utf-8") as f:
+        lines_out = list(_graph_lines(f))
 
-    for line in lines_in:
-        if not line.strip():
+    for i, line in enumerate(lines_out):
+        if _TASK_TOKEN not in line:
             continue
         obj = json.loads(line)
         if obj.get("kind") != "task":
-            lines_out.append(line)
             continue
 
         tid = str(obj.get("id"))
         status = str(obj.get("status") or "")
         if status not in statuses:
-            lines_out.append(line)
             continue
 
         desc = str(obj.get("description") or "")
         if extract_contract(desc) is not None:
-            lines_out.append(line)
             continue
 
         title = str(obj.get("title") or tid)
@@ -92,11 +155,9 @@ def rewrite_graph_with_contracts(*, wg_dir: Path, statuses: set[str], apply: boo
             new_desc = contract_block
         obj["description"] = new_desc
         updated.append(tid)
-        lines_out.append(json.dumps(obj, separators=(",", ":")))
+        lines_out[i] = _dumps(obj)
 
     if apply and updated:
-        tmp = graph_path.with_suffix(".jsonl.tmp")
-        tmp.write_text("\n".join(lines_out) + "\n", encoding="utf-8")
-        tmp.replace(graph_path)
+        _write_graph_lines(graph_path, lines_out)
 
     return ContractPatchResult(updated_tasks=updated)